@@ -10,7 +10,7 @@
 
 use crate::error::{BA2Error, Result};
 use std::fs::File;
-use std::io::{BufReader, Read};
+use std::io::Read;
 use std::path::Path;
 
 /// BA2 archive header
@@ -49,14 +49,16 @@ impl BA2Header {
     pub const HEADER_SIZE: usize = 24;
 
     /// Parse BA2 header from a file
+    ///
+    /// The header is read straight from the file handle: it is a single
+    /// fixed-size read, so a `BufReader` would only add a heap allocation.
     pub fn parse(path: &Path) -> Result<Self> {
-        let file = File::open(path).map_err(|e| BA2Error::ExtractionFailed {
+        let mut file = File::open(path).map_err(|e| BA2Error::ExtractionFailed {
             path: path.to_path_buf(),
             reason: format!("Failed to open file: {e}"),
         })?;
 
-        let mut reader = BufReader::new(file);
-        Self::parse_from_reader(&mut reader, path)
+        Self::parse_from_reader(&mut file, path)
     }
 
     /// Parse BA2 header from a reader
@@ -149,15 +151,10 @@ pub fn num_files_in_ba2(path: &Path) -> Result<u32> {
 
 /// Check if a file is a valid BA2 archive
 ///
-/// This performs a quick validation by:
-/// 1. Checking if the file exists
-/// 2. Checking if it has the correct magic number
-/// 3. Attempting to parse the header
+/// This performs a quick validation by attempting to parse the header.
+/// Missing files and directories fail to open or read, so no separate
+/// existence checks are needed.
 pub fn is_valid_ba2(path: &Path) -> bool {
-    if !path.exists() || !path.is_file() {
-        return false;
-    }
-
     match BA2Header::parse(path) {
         Ok(_) => true,
         Err(e) => {
@@ -251,6 +248,11 @@ mod tests {
         assert!(!header.is_general());
     }
 
+    #[test]
+    fn test_is_valid_ba2_missing_file() {
+        assert!(!is_valid_ba2(Path::new("/nonexistent/file.ba2")));
+    }
+
     #[test]
     fn test_parse_truncated_header() {
         // Create truncated data (less than 24 bytes)
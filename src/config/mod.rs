@@ -9,8 +9,9 @@
 
 use crate::error::{ConfigError, Result};
 use directories::ProjectDirs;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use serde::{Deserialize, Serialize};
+use std::collections::HashSet;
 use std::fs;
 use std::path::{Path, PathBuf};
 
@@ -105,6 +106,14 @@ pub struct AdvancedConfig {
     /// External BA2 tool path (empty = use bundled BSArch.exe)
     #[serde(default)]
     pub ext_ba2_exe: String,
+
+    /// Maximum number of worker threads used for scanning (0 = automatic)
+    #[serde(default)]
+    pub max_workers: usize,
+
+    /// Maximum number of concurrent BSArch.exe extractions (0 = automatic)
+    #[serde(default)]
+    pub max_extract_workers: usize,
 }
 
 /// Log level enumeration
@@ -178,6 +187,43 @@ impl Default for AdvancedConfig {
             extraction_path: String::new(),
             backup_path: String::new(),
             ext_ba2_exe: String::new(),
+            max_workers: 0,
+            max_extract_workers: 0,
+        }
+    }
+}
+
+impl AdvancedConfig {
+    /// Upper bound for the automatic worker count
+    ///
+    /// Keeps the number of concurrently open archives reasonable on
+    /// machines with many logical cores.
+    pub const MAX_AUTO_WORKERS: usize = 16;
+
+    /// Number of worker threads to use for scanning
+    ///
+    /// Returns `max_workers` if it was set explicitly, otherwise the number of
+    /// logical cores capped at [`Self::MAX_AUTO_WORKERS`].
+    pub fn scan_workers(&self) -> usize {
+        if self.max_workers > 0 {
+            self.max_workers
+        } else {
+            std::thread::available_parallelism()
+                .map_or(4, std::num::NonZero::get)
+                .min(Self::MAX_AUTO_WORKERS)
+        }
+    }
+
+    /// Number of BA2 files to extract concurrently
+    ///
+    /// Returns `max_extract_workers` if it was set explicitly, otherwise the
+    /// number of logical cores. Each extraction is a BSArch.exe process that
+    /// spends its time decompressing, so one per core keeps every core busy.
+    pub fn extract_workers(&self) -> usize {
+        if self.max_extract_workers > 0 {
+            self.max_extract_workers
+        } else {
+            std::thread::available_parallelism().map_or(4, std::num::NonZero::get)
         }
     }
 }
@@ -210,20 +256,27 @@ impl AppConfig {
     pub fn load() -> Result<Self> {
         let config_path = Self::config_file_path()?;
 
-        if !config_path.exists() {
-            tracing::info!(
-                "Configuration file not found, creating default at: {}",
-                config_path.display()
-            );
-            let default_config = Self::default();
-            default_config.save()?;
-            return Ok(default_config);
-        }
-
-        let content = fs::read_to_string(&config_path).map_err(|e| ConfigError::LoadFailed {
-            path: config_path.clone(),
-            source: e,
-        })?;
+        // Read straight away and treat "not found" as a first launch, rather
+        // than checking for the file before opening it
+        let content = match fs::read_to_string(&config_path) {
+            Ok(content) => content,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                tracing::info!(
+                    "Configuration file not found, creating default at: {}",
+                    config_path.display()
+                );
+                let default_config = Self::default();
+                default_config.save()?;
+                return Ok(default_config);
+            }
+            Err(e) => {
+                return Err(ConfigError::LoadFailed {
+                    path: config_path,
+                    source: e,
+                }
+                .into());
+            }
+        };
 
         let config: Self = serde_json::from_str(&content)
             .map_err(|e| ConfigError::InvalidFormat(e.to_string()))?;
@@ -309,8 +362,10 @@ impl AppConfig {
         }
 
         // Validate ignored files regex patterns if they look like regex
+        // Absolute paths are exact matches, never regexes
         for pattern in &self.extraction.ignored_files {
-            if looks_like_regex(pattern)
+            if !is_absolute_pattern(pattern)
+                && looks_like_regex(pattern)
                 && let Err(e) = Regex::new(pattern)
             {
                 return Err(ConfigError::InvalidRegex {
@@ -329,7 +384,7 @@ impl AppConfig {
     pub fn get_ignored_patterns(&self) -> Result<Vec<Regex>> {
         let mut patterns = Vec::new();
         for pattern in &self.extraction.ignored_files {
-            if looks_like_regex(pattern) {
+            if !is_absolute_pattern(pattern) && looks_like_regex(pattern) {
                 let regex = Regex::new(pattern).map_err(|e| ConfigError::InvalidRegex {
                     pattern: pattern.clone(),
                     source: e,
@@ -347,6 +402,10 @@ impl AppConfig {
     /// - Substring matches
     /// - Regex patterns
     ///
+    /// This compiles the ignored patterns on every call. When checking many
+    /// files, build an [`IgnoreMatcher`] once with [`Self::ignore_matcher`]
+    /// and reuse it instead.
+    ///
     /// # Arguments
     ///
     /// * `path` - The full path to the file to check
@@ -355,25 +414,106 @@ impl AppConfig {
     ///
     /// `true` if the file should be ignored, `false` otherwise
     pub fn should_ignore_file(&self, path: &Path) -> bool {
-        // Get file name for checking
+        self.ignore_matcher().is_ignored(path)
+    }
+
+    /// Build a precompiled matcher for the configured ignored files
+    pub fn ignore_matcher(&self) -> IgnoreMatcher {
+        IgnoreMatcher::new(&self.extraction.ignored_files)
+    }
+}
+
+/// Precompiled matcher for the ignored files list
+///
+/// Splits the configured patterns into exact paths, plain substrings and
+/// compiled regexes once, so checking a file doesn't parse or compile
+/// anything.
+#[derive(Debug, Clone, Default)]
+pub struct IgnoreMatcher {
+    /// Patterns compared against the full path
+    exact_paths: HashSet<String>,
+    /// Patterns matched as substrings of the file name
+    substrings: Vec<String>,
+    /// Regex patterns, combined so a file name is matched in a single pass
+    regexes: RegexSet,
+    /// Individually compiled patterns, used when the combined set can't be
+    /// built (e.g. it exceeds the regex size limit)
+    fallback_regexes: Vec<Regex>,
+}
+
+impl IgnoreMatcher {
+    /// Build a matcher from the configured ignored files
+    ///
+    /// Absolute paths only match that exact file. Invalid regex patterns are
+    /// logged and skipped.
+    pub fn new(ignored_files: &[String]) -> Self {
+        let mut exact_paths = HashSet::new();
+        let mut substrings = Vec::new();
+        let mut patterns = Vec::new();
+        let mut compiled = Vec::new();
+
+        for pattern in ignored_files {
+            if is_absolute_pattern(pattern) {
+                exact_paths.insert(normalize_ignore_path(Path::new(pattern)));
+                continue;
+            }
+
+            if !looks_like_regex(pattern) {
+                substrings.push(pattern.clone());
+                continue;
+            }
+
+            // Validate each pattern on its own so one bad entry doesn't
+            // disable the rest
+            match Regex::new(pattern) {
+                Ok(regex) => {
+                    patterns.push(pattern.as_str());
+                    compiled.push(regex);
+                }
+                Err(e) => tracing::warn!("Skipping invalid ignore pattern '{}': {}", pattern, e),
+            }
+        }
+
+        // Every pattern compiled on its own, but the combined set can still
+        // fail; match them one by one then rather than dropping them
+        let (regexes, fallback_regexes) = match RegexSet::new(&patterns) {
+            Ok(set) => (set, Vec::new()),
+            Err(e) => {
+                tracing::warn!(
+                    "Failed to combine ignore patterns, matching them individually: {}",
+                    e
+                );
+                (RegexSet::empty(), compiled)
+            }
+        };
+
+        Self {
+            exact_paths,
+            substrings,
+            regexes,
+            fallback_regexes,
+        }
+    }
+
+    /// Check if a file should be ignored
+    ///
+    /// The full path is checked for exact matches, the file name against
+    /// substring and regex patterns.
+    pub fn is_ignored(&self, path: &Path) -> bool {
         let Some(file_name) = path.file_name().and_then(|n| n.to_str()) else {
             return false;
         };
 
         // Check exact path match
-        if self
-            .extraction
-            .ignored_files
-            .contains(&path.to_string_lossy().to_string())
-        {
+        if !self.exact_paths.is_empty() && self.exact_paths.contains(&normalize_ignore_path(path)) {
             return true;
         }
 
-        // Get regex patterns (ignore errors, just skip regex matching if it fails)
-        let regex_patterns = self.get_ignored_patterns().unwrap_or_default();
-
-        // Use the standalone function for the actual checking logic
-        should_ignore_file(file_name, &self.extraction.ignored_files, &regex_patterns)
+        self.substrings
+            .iter()
+            .any(|s| file_name.contains(s.as_str()))
+            || self.regexes.is_match(file_name)
+            || self.fallback_regexes.iter().any(|r| r.is_match(file_name))
     }
 }
 
@@ -400,6 +540,39 @@ pub fn resolve_path(path: &str) -> Result<PathBuf> {
     Ok(resolved)
 }
 
+/// Check if an ignore pattern is an absolute file path
+///
+/// Ignoring a file from the table stores its full path, which is matched
+/// exactly rather than compiled as a regex (Windows separators aren't valid
+/// regex escapes). Drive-letter and UNC forms are recognised on every
+/// platform so a config written on Windows behaves the same elsewhere.
+fn is_absolute_pattern(pattern: &str) -> bool {
+    let bytes = pattern.as_bytes();
+    let windows_drive = bytes.len() > 2
+        && bytes[0].is_ascii_alphabetic()
+        && bytes[1] == b':'
+        && matches!(bytes[2], b'\\' | b'/');
+
+    windows_drive || pattern.starts_with("\\\\") || Path::new(pattern).is_absolute()
+}
+
+/// Normalize a path for exact ignore matching
+///
+/// Paths are canonicalized when they exist, so `..` segments and symlinks
+/// don't stop a stored path from matching the scanned one. Windows paths
+/// are compared case-insensitively with a single separator style, as the
+/// file system treats them.
+fn normalize_ignore_path(path: &Path) -> String {
+    let resolved = dunce::canonicalize(path).unwrap_or_else(|_| path.to_path_buf());
+    let normalized = resolved.to_string_lossy();
+
+    if cfg!(windows) {
+        normalized.replace('/', "\\").to_ascii_lowercase()
+    } else {
+        normalized.into_owned()
+    }
+}
+
 /// Check if a string looks like a regex pattern
 ///
 /// This is a simple heuristic to avoid compiling plain strings as regex.
@@ -427,7 +600,7 @@ pub fn should_ignore_file(
 ) -> bool {
     // First check exact matches and substrings
     for pattern in ignored_files {
-        if !looks_like_regex(pattern) {
+        if !is_absolute_pattern(pattern) && !looks_like_regex(pattern) {
             // Simple substring match
             if file_name.contains(pattern) {
                 return true;
@@ -448,6 +621,7 @@ pub fn should_ignore_file(
 #[cfg(test)]
 mod tests {
     use super::*;
+    use tempfile::TempDir;
 
     #[test]
     fn test_default_config() {
@@ -513,6 +687,89 @@ mod tests {
         assert!(!should_ignore_file("main.ba2", &ignored, &patterns));
     }
 
+    #[test]
+    fn test_ignore_matcher() {
+        let ignored = vec![
+            "debug".to_string(),
+            ".*_test\\.ba2$".to_string(),
+            "/mods/Exact/Exact_Main.ba2".to_string(),
+        ];
+        let matcher = IgnoreMatcher::new(&ignored);
+
+        assert!(matcher.is_ignored(Path::new("/mods/A/debug_main.ba2")));
+        assert!(matcher.is_ignored(Path::new("/mods/B/mod_test.ba2")));
+        assert!(matcher.is_ignored(Path::new("/mods/Exact/Exact_Main.ba2")));
+        assert!(!matcher.is_ignored(Path::new("/mods/C/main.ba2")));
+    }
+
+    #[test]
+    fn test_ignore_matcher_skips_invalid_regex() {
+        let ignored = vec!["[invalid".to_string(), "skip".to_string()];
+        let matcher = IgnoreMatcher::new(&ignored);
+
+        assert!(matcher.is_ignored(Path::new("skip_main.ba2")));
+        assert!(!matcher.is_ignored(Path::new("other_main.ba2")));
+    }
+
+    #[test]
+    fn test_ignore_matcher_falls_back_when_set_fails() {
+        // Each pattern compiles on its own, but together they exceed the
+        // regex size limit for a combined set
+        let ignored: Vec<String> = ["a", "b", "c", "d"]
+            .iter()
+            .map(|p| format!(r"^{p}\w{{100}}\.ba2$"))
+            .collect();
+        let matcher = IgnoreMatcher::new(&ignored);
+
+        assert!(matcher.regexes.is_empty());
+        assert_eq!(matcher.fallback_regexes.len(), 4);
+
+        let name = format!("c{}.ba2", "x".repeat(100));
+        assert!(matcher.is_ignored(Path::new(&name)));
+        assert!(!matcher.is_ignored(Path::new("c_short.ba2")));
+    }
+
+    #[test]
+    fn test_ignored_absolute_paths_are_exact() {
+        let mut config = AppConfig::default();
+        let windows_path = r"C:\Games\Fallout 4\Mods\X\X - Main.ba2".to_string();
+        config.extraction.ignored_files.push(windows_path.clone());
+        config
+            .extraction
+            .ignored_files
+            .push("/mods/Y/Y - Main.ba2".to_string());
+
+        // Backslash paths aren't compiled as regexes, so saving still works
+        assert!(config.validate().is_ok());
+        assert!(config.get_ignored_patterns().unwrap().is_empty());
+
+        let matcher = config.ignore_matcher();
+        assert!(matcher.is_ignored(Path::new("/mods/Y/Y - Main.ba2")));
+        assert!(!matcher.is_ignored(Path::new("/other/Y/Y - Main.ba2")));
+        assert!(matcher.regexes.is_empty());
+        assert!(
+            matcher
+                .exact_paths
+                .contains(&normalize_ignore_path(Path::new(&windows_path)))
+        );
+    }
+
+    #[test]
+    fn test_ignored_absolute_paths_are_normalized() {
+        let temp_dir = TempDir::new().unwrap();
+        let mod_dir = temp_dir.path().join("Mod");
+        fs::create_dir(&mod_dir).unwrap();
+        let file_path = mod_dir.join("Mod - Main.ba2");
+        fs::write(&file_path, b"BTDX").unwrap();
+
+        // Stored with a `..` segment, probed with the plain path
+        let stored = mod_dir.join("..").join("Mod").join("Mod - Main.ba2");
+        let matcher = IgnoreMatcher::new(&[stored.to_string_lossy().into_owned()]);
+
+        assert!(matcher.is_ignored(&file_path));
+        assert!(!matcher.is_ignored(&temp_dir.path().join("Mod - Main.ba2")));
+    }
+
     #[test]
     fn test_invalid_regex_validation() {
         let mut config = AppConfig::default();
@@ -520,6 +777,26 @@ mod tests {
         assert!(config.validate().is_err());
     }
 
+    #[test]
+    fn test_scan_workers() {
+        let mut config = AppConfig::default();
+        let auto = config.advanced.scan_workers();
+        assert!((1..=AdvancedConfig::MAX_AUTO_WORKERS).contains(&auto));
+
+        config.advanced.max_workers = 3;
+        assert_eq!(config.advanced.scan_workers(), 3);
+    }
+
+    #[test]
+    fn test_extract_workers() {
+        let mut config = AppConfig::default();
+        let cores = std::thread::available_parallelism().map_or(4, std::num::NonZero::get);
+        assert_eq!(config.advanced.extract_workers(), cores);
+
+        config.advanced.max_extract_workers = 12;
+        assert_eq!(config.advanced.extract_workers(), 12);
+    }
+
     #[test]
     fn test_log_level_serialization() {
         let level = LogLevel::Debug;
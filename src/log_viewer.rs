@@ -76,6 +76,33 @@ impl LogLevel {
             Self::Trace => "#808080", // Gray
         }
     }
+
+    /// Get the color for this level as an opaque ARGB value
+    ///
+    /// Matches [`Self::color`] without parsing a hex string for every entry.
+    pub const fn argb(&self) -> u32 {
+        match self {
+            Self::Error => 0xFFFF_0000,
+            Self::Warn => 0xFFFF_6A5B,
+            Self::Info => 0xFFFF_FFFF,
+            Self::Debug => 0xFFA0_A0A0,
+            Self::Trace => 0xFF80_8080,
+        }
+    }
+
+    /// Convert from the log viewer's filter index (0 = Error ... 4 = Trace)
+    ///
+    /// Returns `None` (show everything) for any other index.
+    pub const fn from_filter_index(index: i32) -> Option<Self> {
+        match index {
+            0 => Some(Self::Error),
+            1 => Some(Self::Warn),
+            2 => Some(Self::Info),
+            3 => Some(Self::Debug),
+            4 => Some(Self::Trace),
+            _ => None,
+        }
+    }
 }
 
 impl std::fmt::Display for LogLevel {
@@ -188,17 +215,31 @@ impl LogViewer {
     }
 
     /// Load logs from a specific file
+    ///
+    /// Lines are read as bytes into one reused buffer and decoded lossily,
+    /// so a stray invalid UTF-8 sequence doesn't abort loading the log.
     fn load_from_file(&mut self, path: &PathBuf) -> Result<()> {
         let file = File::open(path)
             .with_context(|| format!("Failed to open log file: {}", path.display()))?;
 
-        let reader = BufReader::new(file);
+        let mut reader = BufReader::new(file);
+        let mut buf = Vec::new();
 
         self.entries.clear();
 
-        for line in reader.lines() {
-            let line = line.with_context(|| "Failed to read log line")?;
-            self.entries.push(LogEntry::parse(line));
+        loop {
+            buf.clear();
+            let read = reader
+                .read_until(b'\n', &mut buf)
+                .with_context(|| "Failed to read log line")?;
+            if read == 0 {
+                break;
+            }
+
+            let line = buf.strip_suffix(b"\n").unwrap_or(&buf);
+            let line = line.strip_suffix(b"\r").unwrap_or(line);
+            self.entries
+                .push(LogEntry::parse(String::from_utf8_lossy(line).into_owned()));
         }
 
         Ok(())
@@ -206,11 +247,17 @@ impl LogViewer {
 
     /// Get filtered entries based on current filter level
     pub fn get_filtered_entries(&self) -> Vec<LogEntry> {
+        self.filtered_entries().cloned().collect()
+    }
+
+    /// Iterate over the entries matching the current filter level
+    ///
+    /// Borrows the entries, so callers that only read them (such as building
+    /// UI rows) don't have to clone the whole log first.
+    pub fn filtered_entries(&self) -> impl Iterator<Item = &LogEntry> {
         self.entries
             .iter()
             .filter(|entry| entry.matches_filter(self.filter_level))
-            .cloned()
-            .collect()
     }
 
     /// Get all entries (unfiltered)
@@ -306,6 +353,20 @@ mod tests {
         assert_eq!(entry.raw_line, line);
     }
 
+    #[test]
+    fn test_argb_matches_color() {
+        for level in [
+            LogLevel::Trace,
+            LogLevel::Debug,
+            LogLevel::Info,
+            LogLevel::Warn,
+            LogLevel::Error,
+        ] {
+            let rgb = u32::from_str_radix(&level.color()[1..], 16).unwrap();
+            assert_eq!(level.argb(), rgb | 0xFF00_0000);
+        }
+    }
+
     #[test]
     fn test_log_level_ordering() {
         assert!(LogLevel::Error > LogLevel::Warn);
@@ -353,6 +414,7 @@ mod tests {
 
         // No filter - show all
         assert_eq!(viewer.get_filtered_entries().len(), 4);
+        assert_eq!(viewer.filtered_entries().count(), 4);
 
         // Info filter - show info, warn, error
         viewer.set_filter(Some(LogLevel::Info));
@@ -363,6 +425,31 @@ mod tests {
         assert_eq!(viewer.get_filtered_entries().len(), 1);
     }
 
+    #[test]
+    fn test_load_from_file_decodes_invalid_utf8() {
+        let temp_dir = tempfile::TempDir::new().unwrap();
+        let path = temp_dir.path().join("unpackrr.log");
+        std::fs::write(
+            &path,
+            b"2025-01-22T10:30:45.123456Z  INFO test: first\r\nbad \xff byte\nlast",
+        )
+        .unwrap();
+
+        let mut viewer = LogViewer::new();
+        viewer.load_from_file(&path).unwrap();
+
+        let lines: Vec<&str> = viewer.entries.iter().map(|e| e.raw_line.as_str()).collect();
+        assert_eq!(
+            lines,
+            [
+                "2025-01-22T10:30:45.123456Z  INFO test: first",
+                "bad \u{fffd} byte",
+                "last"
+            ]
+        );
+        assert_eq!(viewer.entries[0].level, Some(LogLevel::Info));
+    }
+
     #[test]
     fn test_level_counts() {
         let mut viewer = LogViewer::new();
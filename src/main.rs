@@ -2,13 +2,13 @@ use std::panic;
 use unpackrr::{config::AppConfig, logging, ui};
 
 fn main() -> anyhow::Result<()> {
-    // Load configuration (if available)
-    let config = AppConfig::load().ok();
+    // Load configuration, keeping the error to report once logging is up
+    let config = AppConfig::load();
 
     // Initialize logging system
     // This sets up both console and file logging with rotation
     // Hold the guard for the application lifetime to ensure logs are flushed on shutdown
-    let _log_guard = logging::init(config.as_ref())?;
+    let _log_guard = logging::init(config.as_ref().ok())?;
 
     // Phase 3.3: Set up panic handler to log panics
     panic::set_hook(Box::new(|panic_info| {
@@ -37,16 +37,17 @@ fn main() -> anyhow::Result<()> {
         logging::get_log_dir().map_or_else(|_| "Unknown".to_string(), |p| p.display().to_string())
     );
 
-    if let Some(ref cfg) = config {
-        tracing::info!("Configuration loaded successfully");
-        tracing::debug!("Debug mode: {}", cfg.advanced.show_debug);
-        tracing::debug!("Log level: {:?}", cfg.advanced.log_level);
-    } else {
-        tracing::warn!("Configuration not found, using defaults");
+    match &config {
+        Ok(cfg) => {
+            tracing::info!("Configuration loaded successfully");
+            tracing::debug!("Debug mode: {}", cfg.advanced.show_debug);
+            tracing::debug!("Log level: {:?}", cfg.advanced.log_level);
+        }
+        Err(e) => tracing::error!("Failed to load configuration, using defaults: {}", e),
     }
 
     // Run the UI (this will initialize and run the Slint event loop)
-    ui::run()?;
+    ui::run(config.unwrap_or_default())?;
 
     tracing::info!("Application shutting down");
 
@@ -6,6 +6,7 @@
 //! - Display formatting helpers
 
 use crate::operations::{BA2FileInfo, format_size};
+use std::cell::OnceCell;
 use std::cmp::Ordering;
 use std::path::PathBuf;
 
@@ -15,28 +16,38 @@ use std::path::PathBuf;
 /// with additional functionality for sorting and display.
 #[derive(Debug, Clone, PartialEq, Eq)]
 pub struct FileEntry {
-    /// File name (without path)
-    pub file_name: String,
+    /// File name (without path), private so it can't drift from `name_key`
+    file_name: String,
 
-    /// File size in bytes
-    pub file_size: u64,
+    /// File size in bytes, private so it can't drift from `size_text`
+    file_size: u64,
 
     /// Number of files contained in the archive
     pub num_files: u32,
 
-    /// Parent directory name (mod folder)
-    pub dir_name: String,
+    /// Parent directory name (mod folder), private so it can't drift from
+    /// `mod_key`
+    dir_name: String,
 
     /// Full path to the file
     pub full_path: PathBuf,
 
     /// Whether the file appears to be corrupted
     pub is_bad: bool,
+
+    /// Human-readable file size, formatted once on creation
+    size_text: String,
+
+    /// Lowercased file name, used as the name sort key
+    name_key: String,
+
+    /// Lowercased mod folder name, used as the mod sort key
+    mod_key: String,
 }
 
 impl FileEntry {
     /// Create a new `FileEntry`
-    pub const fn new(
+    pub fn new(
         file_name: String,
         file_size: u64,
         num_files: u32,
@@ -45,18 +56,29 @@ impl FileEntry {
         is_bad: bool,
     ) -> Self {
         Self {
+            name_key: file_name.to_lowercase(),
+            mod_key: dir_name.to_lowercase(),
             file_name,
             file_size,
             num_files,
             dir_name,
             full_path,
             is_bad,
+            size_text: format_size(file_size),
         }
     }
 
+    /// Get file size in bytes
+    pub const fn file_size(&self) -> u64 {
+        self.file_size
+    }
+
     /// Get human-readable file size (e.g., "10.5 MiB")
-    pub fn size_display(&self) -> String {
-        format_size(self.file_size)
+    ///
+    /// The string is formatted when the entry is created, so the table can
+    /// be rebuilt without reformatting every size.
+    pub fn size_display(&self) -> &str {
+        &self.size_text
     }
 
     /// Get file name for display
@@ -83,14 +105,14 @@ impl FileEntry {
 /// Convert from `BA2FileInfo` to `FileEntry`
 impl From<BA2FileInfo> for FileEntry {
     fn from(info: BA2FileInfo) -> Self {
-        Self {
-            file_name: info.file_name,
-            file_size: info.file_size,
-            num_files: info.num_files,
-            dir_name: info.dir_name,
-            full_path: info.full_path,
-            is_bad: info.is_bad,
-        }
+        Self::new(
+            info.file_name,
+            info.file_size,
+            info.num_files,
+            info.dir_name,
+            info.full_path,
+            info.is_bad,
+        )
     }
 }
 
@@ -109,12 +131,21 @@ pub enum SortBy {
 
 impl FileEntry {
     /// Compare two entries based on a sorting criterion
+    ///
+    /// Names are compared case-insensitively using keys lowercased when the
+    /// entry was created, so sorting doesn't lowercase on every comparison.
     pub fn compare(&self, other: &Self, sort_by: SortBy) -> Ordering {
         match sort_by {
-            SortBy::Name => self.file_name.cmp(&other.file_name),
+            SortBy::Name => self
+                .name_key
+                .cmp(&other.name_key)
+                .then_with(|| self.file_name.cmp(&other.file_name)),
             SortBy::Size => self.file_size.cmp(&other.file_size), // Smallest first (Natural)
             SortBy::FileCount => self.num_files.cmp(&other.num_files), // Fewest first (Natural)
-            SortBy::ModName => self.dir_name.cmp(&other.dir_name),
+            SortBy::ModName => self
+                .mod_key
+                .cmp(&other.mod_key)
+                .then_with(|| self.dir_name.cmp(&other.dir_name)),
         }
     }
 }
@@ -137,30 +168,34 @@ impl PartialOrd for FileEntry {
 #[derive(Debug, Clone, Default)]
 pub struct FileEntryList {
     entries: Vec<FileEntry>,
+
+    /// File sizes in ascending order, built on first use and cleared
+    /// whenever the set of entries changes
+    sorted_sizes: OnceCell<Vec<u64>>,
 }
 
 impl FileEntryList {
     /// Create a new empty list
     pub const fn new() -> Self {
-        Self {
-            entries: Vec::new(),
-        }
+        Self::from_vec(Vec::new())
     }
 
     /// Create from a vector of entries
     pub const fn from_vec(entries: Vec<FileEntry>) -> Self {
-        Self { entries }
+        Self {
+            entries,
+            sorted_sizes: OnceCell::new(),
+        }
     }
 
     /// Create from `BA2FileInfo` results
     pub fn from_scan_results(results: Vec<BA2FileInfo>) -> Self {
-        Self {
-            entries: results.into_iter().map(FileEntry::from).collect(),
-        }
+        Self::from_vec(results.into_iter().map(FileEntry::from).collect())
     }
 
     /// Add an entry to the list
     pub fn push(&mut self, entry: FileEntry) {
+        self.sorted_sizes.take();
         self.entries.push(entry);
     }
 
@@ -180,7 +215,9 @@ impl FileEntryList {
     }
 
     /// Get a mutable reference to all entries
-    pub const fn entries_mut(&mut self) -> &mut Vec<FileEntry> {
+    pub fn entries_mut(&mut self) -> &mut Vec<FileEntry> {
+        // The caller may change sizes, so the cached order can't be trusted
+        self.sorted_sizes.take();
         &mut self.entries
     }
 
@@ -200,6 +237,7 @@ impl FileEntryList {
     /// Remove entry at index
     pub fn remove(&mut self, index: usize) -> Option<FileEntry> {
         if index < self.entries.len() {
+            self.sorted_sizes.take();
             Some(self.entries.remove(index))
         } else {
             None
@@ -223,9 +261,33 @@ impl FileEntryList {
 
     /// Filter entries to remove corrupted files
     pub fn filter_bad_files(&mut self) {
+        self.sorted_sizes.take();
         self.entries.retain(|e| !e.is_bad);
     }
 
+    /// Get all file sizes in ascending order
+    ///
+    /// Sorted once and reused until entries are added or removed, so
+    /// threshold calculations don't have to sort the list every time.
+    pub fn sorted_sizes(&self) -> &[u64] {
+        self.sorted_sizes.get_or_init(|| {
+            let mut sizes: Vec<u64> = self.entries.iter().map(|e| e.file_size).collect();
+            sizes.sort_unstable();
+            sizes
+        })
+    }
+
+    /// Get the size of the n-th largest file (1-indexed)
+    ///
+    /// Returns `None` if `n` is zero or larger than the number of entries.
+    pub fn nth_largest_size(&self, n: usize) -> Option<u64> {
+        let sizes = self.sorted_sizes();
+        if n == 0 || n > sizes.len() {
+            return None;
+        }
+        Some(sizes[sizes.len() - n])
+    }
+
     /// Get indices of bad files
     pub fn bad_file_indices(&self) -> Vec<usize> {
         self.entries
@@ -266,7 +328,7 @@ mod tests {
         assert_eq!(entry.name_display(), "test.ba2");
         assert_eq!(entry.file_count_display(), "25");
         assert_eq!(entry.mod_display(), "TestMod");
-        assert!(!entry.size_display().is_empty());
+        assert_eq!(entry.size_display(), format_size(1500));
     }
 
     #[test]
@@ -284,6 +346,20 @@ mod tests {
         assert_eq!(entries[2].file_name, "zebra.ba2");
     }
 
+    #[test]
+    fn test_sorting_by_name_ignores_case() {
+        let mut entries = vec![
+            create_test_entry("beta.ba2", 1000, 10, false),
+            create_test_entry("Zebra.ba2", 2000, 20, false),
+            create_test_entry("Alpha.ba2", 1500, 15, false),
+        ];
+
+        entries.sort_by(|a, b| a.compare(b, SortBy::Name));
+        assert_eq!(entries[0].file_name, "Alpha.ba2");
+        assert_eq!(entries[1].file_name, "beta.ba2");
+        assert_eq!(entries[2].file_name, "Zebra.ba2");
+    }
+
     #[test]
     fn test_sorting_by_size() {
         let mut entries = vec![
@@ -356,6 +432,27 @@ mod tests {
         assert_eq!(bad_indices, vec![1]);
     }
 
+    #[test]
+    fn test_size_thresholds() {
+        let mut list = FileEntryList::from_vec(vec![
+            create_test_entry("b.ba2", 2000, 10, false),
+            create_test_entry("c.ba2", 3000, 10, false),
+            create_test_entry("a.ba2", 1000, 10, false),
+        ]);
+
+        assert_eq!(list.sorted_sizes(), &[1000, 2000, 3000]);
+        assert_eq!(list.nth_largest_size(1), Some(3000));
+        assert_eq!(list.nth_largest_size(3), Some(1000));
+        assert_eq!(list.nth_largest_size(0), None);
+        assert_eq!(list.nth_largest_size(4), None);
+
+        // Sorting keeps the cache, changing entries rebuilds it
+        list.sort_by(SortBy::Name, false);
+        assert_eq!(list.nth_largest_size(2), Some(2000));
+        list.push(create_test_entry("d.ba2", 500, 10, false));
+        assert_eq!(list.sorted_sizes(), &[500, 1000, 2000, 3000]);
+    }
+
     #[test]
     fn test_filter_bad_files() {
         let mut list = FileEntryList::from_vec(vec![
@@ -7,10 +7,31 @@ use crate::config::AppConfig;
 use crate::error::{BA2Error, Result};
 use crate::models::FileEntry;
 use futures::stream::{self, StreamExt};
+use std::collections::VecDeque;
 use std::path::{Path, PathBuf};
-use std::sync::Arc;
+use std::process::Stdio;
+use std::sync::LazyLock;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use tokio::io::{AsyncBufReadExt, AsyncRead, BufReader};
 use tokio::process::Command;
-use tokio::sync::{Semaphore, mpsc};
+use tokio::sync::mpsc;
+
+/// Number of trailing output lines kept from BSArch.exe for error reporting
+const OUTPUT_TAIL_LINES: usize = 64;
+
+/// Bundled BSArch.exe in the same directory as the executable
+///
+/// Resolved once, since the executable location doesn't change during a run.
+static BUNDLED_BSARCH_PATH: LazyLock<PathBuf> = LazyLock::new(|| {
+    std::env::current_exe().map_or_else(
+        |_| PathBuf::from("BSArch.exe"),
+        |exe_path| {
+            exe_path
+                .parent()
+                .map_or_else(|| PathBuf::from("BSArch.exe"), |p| p.join("BSArch.exe"))
+        },
+    )
+});
 
 /// Progress updates during extraction
 #[derive(Debug, Clone)]
@@ -129,13 +150,7 @@ pub async fn extract_ba2_file(
     bsarch_path: &Path,
 ) -> Result<()> {
     // Validate BA2 file exists
-    if !ba2_path.exists() {
-        return Err(BA2Error::ExtractionFailed {
-            path: ba2_path.to_path_buf(),
-            reason: "File not found".to_string(),
-        }
-        .into());
-    }
+    check_ba2_exists(ba2_path)?;
 
     // Validate BSArch.exe exists
     if !bsarch_path.exists() {
@@ -145,6 +160,27 @@ pub async fn extract_ba2_file(
         .into());
     }
 
+    unpack_ba2(ba2_path, output_dir, bsarch_path).await
+}
+
+/// Check that a BA2 file exists before handing it to BSArch.exe
+fn check_ba2_exists(ba2_path: &Path) -> Result<()> {
+    if ba2_path.exists() {
+        Ok(())
+    } else {
+        Err(BA2Error::ExtractionFailed {
+            path: ba2_path.to_path_buf(),
+            reason: "File not found".to_string(),
+        }
+        .into())
+    }
+}
+
+/// Run BSArch.exe to unpack a BA2 file
+///
+/// Assumes `bsarch_path` has already been checked, so batch extraction
+/// only has to look for the tool once.
+async fn unpack_ba2(ba2_path: &Path, output_dir: Option<&Path>, bsarch_path: &Path) -> Result<()> {
     // Determine output directory
     let Some(output_path) = output_dir.or_else(|| ba2_path.parent()) else {
         return Err(BA2Error::ExtractionFailed {
@@ -166,17 +202,43 @@ pub async fn extract_ba2_file(
         cmd.creation_flags(CREATE_NO_WINDOW);
     }
 
-    let output = cmd.output().await.map_err(|e| BA2Error::ExtractionFailed {
+    // Stream the output instead of buffering it; BSArch.exe prints every
+    // extracted file, which adds up for large archives
+    // BSArch.exe gets no stdin, as with Command::output(), so a prompt can't
+    // wait on the console
+    cmd.stdin(Stdio::null())
+        .stdout(Stdio::piped())
+        .stderr(Stdio::piped());
+
+    let mut child = cmd.spawn().map_err(|e| BA2Error::ExtractionFailed {
         path: ba2_path.to_path_buf(),
         reason: format!("Failed to spawn BSArch.exe: {e}"),
     })?;
 
+    let stdout = child.stdout.take();
+    let stderr = child.stderr.take();
+    let (stdout_tail, stderr_tail, status) = tokio::join!(
+        read_output_tail(stdout),
+        read_output_tail(stderr),
+        child.wait()
+    );
+
+    let status = status.map_err(|e| BA2Error::ExtractionFailed {
+        path: ba2_path.to_path_buf(),
+        reason: format!("Failed to wait for BSArch.exe: {e}"),
+    })?;
+
     // Check if extraction was successful
-    if !output.status.success() {
-        let stderr = String::from_utf8_lossy(&output.stderr);
+    if !status.success() {
+        // Prefer stderr, but BSArch.exe often reports errors on stdout
+        let tail = if stderr_tail.is_empty() {
+            stdout_tail
+        } else {
+            stderr_tail
+        };
         return Err(BA2Error::ExtractionFailed {
             path: ba2_path.to_path_buf(),
-            reason: format!("BSArch.exe failed: {stderr}"),
+            reason: format!("BSArch.exe failed: {}", join_output_tail(&tail)),
         }
         .into());
     }
@@ -184,6 +246,48 @@ pub async fn extract_ba2_file(
     Ok(())
 }
 
+/// Read a process output stream, keeping only the last lines
+///
+/// Line buffers are recycled once the tail is full, so reading a long
+/// stream doesn't allocate per line.
+async fn read_output_tail<R: AsyncRead + Unpin>(stream: Option<R>) -> VecDeque<Vec<u8>> {
+    let mut tail = VecDeque::with_capacity(OUTPUT_TAIL_LINES);
+    let Some(stream) = stream else {
+        return tail;
+    };
+
+    let mut reader = BufReader::new(stream);
+    loop {
+        let mut line = if tail.len() == OUTPUT_TAIL_LINES {
+            tail.pop_front().unwrap_or_default()
+        } else {
+            Vec::new()
+        };
+        line.clear();
+
+        match reader.read_until(b'\n', &mut line).await {
+            Ok(0) => break,
+            Ok(_) => tail.push_back(line),
+            Err(e) => {
+                // Keep draining so BSArch.exe never blocks on a full pipe;
+                // if that fails too, the pipe is closed on return and its
+                // writes fail instead of blocking
+                tracing::warn!("Failed to read BSArch.exe output: {}", e);
+                let _ = tokio::io::copy(&mut reader, &mut tokio::io::sink()).await;
+                break;
+            }
+        }
+    }
+
+    tail
+}
+
+/// Join collected output lines into a single trimmed string
+fn join_output_tail(tail: &VecDeque<Vec<u8>>) -> String {
+    let bytes: Vec<u8> = tail.iter().flatten().copied().collect();
+    String::from_utf8_lossy(&bytes).trim().to_string()
+}
+
 /// Extract multiple BA2 files with progress reporting and parallelism
 ///
 /// # Arguments
@@ -197,63 +301,59 @@ pub async fn extract_ba2_file(
 /// `ExtractionResult` with details about successful and failed extractions
 ///
 pub async fn extract_all(
-    files: Vec<FileEntry>,
+    mut files: Vec<FileEntry>,
     config: AppConfig,
     progress_tx: Option<mpsc::Sender<ExtractionProgress>>,
 ) -> Result<ExtractionResult> {
+    // Archives whose header failed to parse during the scan would only make
+    // BSArch.exe fail, so skip them without spawning it
+    if config.extraction.ignore_bad_files {
+        let before = files.len();
+        files.retain(|f| !f.is_corrupted());
+        let skipped = before - files.len();
+        if skipped > 0 {
+            tracing::info!("Skipping {} corrupted BA2 files", skipped);
+        }
+    }
+
     let total = files.len();
 
     // Use external BA2 tool if specified, otherwise use bundled BSArch.exe
     let bsarch_path = if config.advanced.ext_ba2_exe.is_empty() {
-        // Default to bundled version in the same directory as the executable
-        std::env::current_exe().map_or_else(
-            |_| PathBuf::from("BSArch.exe"),
-            |exe_path| {
-                exe_path
-                    .parent()
-                    .map_or_else(|| PathBuf::from("BSArch.exe"), |p| p.join("BSArch.exe"))
-            },
-        )
+        BUNDLED_BSARCH_PATH.clone()
     } else {
         PathBuf::from(&config.advanced.ext_ba2_exe)
     };
 
-    // Determine concurrency limit
-    // Use number of logical cores, capped between 1 and 8 to avoid resource exhaustion
-    let concurrency_limit = std::thread::available_parallelism()
-        .map(std::num::NonZero::get)
-        .unwrap_or(4)
-        .clamp(1, 8);
+    // Determine concurrency limit from configuration
+    let concurrency_limit = config.advanced.extract_workers();
 
     tracing::debug!("Extracting with concurrency limit: {}", concurrency_limit);
 
-    let semaphore = Arc::new(Semaphore::new(concurrency_limit));
-    let current_counter = Arc::new(std::sync::atomic::AtomicUsize::new(0));
+    // Check for BSArch.exe once per batch instead of once per file
+    let bsarch_found = bsarch_path.exists();
+    if !bsarch_found {
+        tracing::error!("BSArch.exe not found at {}", bsarch_path.display());
+    }
 
-    // Create a stream of extraction futures
-    let results: Vec<FileExtractionResult> = stream::iter(files)
-        .map(|file_entry| {
-            let bsarch_path = bsarch_path.clone();
-            let progress_tx = progress_tx.clone();
-            let semaphore = semaphore.clone();
-            let current_counter = current_counter.clone();
+    let current_counter = AtomicUsize::new(0);
 
-            // We must clone the data we need before the async block
-            let file_path = file_entry.full_path.clone();
-            let file_name = file_entry.file_name;
+    // Build the job list up front so workers only own the data they need
+    let jobs: Vec<(String, PathBuf)> = files
+        .into_iter()
+        .map(|file_entry| (file_entry.name_display().to_owned(), file_entry.full_path))
+        .collect();
 
-            async move {
-                // Acquire permit to limit concurrency
-                let Ok(_permit) = semaphore.acquire().await else {
-                    // Semaphore was closed unexpectedly - treat as extraction failure
-                    return FileExtractionResult {
-                        file_path: file_path.clone(),
-                        success: false,
-                        error: Some("Extraction semaphore was closed unexpectedly".to_string()),
-                    };
-                };
+    // Create a stream of extraction futures; `buffer_unordered` bounds how
+    // many BSArch.exe processes run at the same time
+    let results: Vec<FileExtractionResult> = stream::iter(jobs)
+        .map(|(file_name, file_path)| {
+            let bsarch_path = &bsarch_path;
+            let progress_tx = progress_tx.clone();
+            let current_counter = &current_counter;
 
-                let current = current_counter.fetch_add(1, std::sync::atomic::Ordering::SeqCst) + 1;
+            async move {
+                let current = current_counter.fetch_add(1, Ordering::Relaxed) + 1;
 
                 // Send started progress
                 if let Some(ref tx) = progress_tx {
@@ -267,15 +367,23 @@ pub async fn extract_all(
                 }
 
                 // Perform extraction
-                let extraction_result = match extract_ba2_file(&file_path, None, &bsarch_path).await
-                {
+                let extraction: Result<()> = match check_ba2_exists(&file_path) {
+                    Ok(()) if bsarch_found => unpack_ba2(&file_path, None, bsarch_path).await,
+                    Ok(()) => Err(BA2Error::BSArchNotFound {
+                        path: bsarch_path.clone(),
+                    }
+                    .into()),
+                    Err(e) => Err(e),
+                };
+
+                let extraction_result = match extraction {
                     Ok(()) => FileExtractionResult {
-                        file_path: file_path.clone(),
+                        file_path,
                         success: true,
                         error: None,
                     },
                     Err(e) => FileExtractionResult {
-                        file_path: file_path.clone(),
+                        file_path,
                         success: false,
                         error: Some(e.to_string()),
                     },
@@ -285,7 +393,7 @@ pub async fn extract_all(
                 if let Some(ref tx) = progress_tx {
                     let _ = tx
                         .send(ExtractionProgress::Completed {
-                            file_name: file_name.clone(),
+                            file_name,
                             success: extraction_result.success,
                             error: extraction_result.error.clone(),
                         })
@@ -295,7 +403,7 @@ pub async fn extract_all(
                 extraction_result
             }
         })
-        .buffer_unordered(concurrency_limit) // Run up to concurrency_limit futures in parallel
+        .buffer_unordered(concurrency_limit)
         .collect()
         .await;
 
@@ -321,6 +429,11 @@ pub async fn extract_all(
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::pin::Pin;
+    use std::sync::Arc;
+    use std::sync::atomic::AtomicBool;
+    use std::task::{Context, Poll};
+    use tokio::io::ReadBuf;
 
     #[test]
     fn test_extraction_result_creation() {
@@ -389,6 +502,79 @@ mod tests {
         );
     }
 
+    #[tokio::test]
+    async fn test_read_output_tail_keeps_last_lines() {
+        let output: String = (0..100).map(|i| format!("line {i}\n")).collect();
+        let tail = read_output_tail(Some(output.as_bytes())).await;
+
+        assert_eq!(tail.len(), OUTPUT_TAIL_LINES);
+        assert_eq!(tail.front().unwrap(), b"line 36\n");
+        assert_eq!(tail.back().unwrap(), b"line 99\n");
+        assert!(join_output_tail(&tail).ends_with("line 99"));
+    }
+
+    /// Reader that fails once and then yields its data
+    struct FailOnceReader {
+        failed: bool,
+        data: &'static [u8],
+        drained: Arc<AtomicBool>,
+    }
+
+    impl AsyncRead for FailOnceReader {
+        fn poll_read(
+            mut self: Pin<&mut Self>,
+            _cx: &mut Context<'_>,
+            buf: &mut ReadBuf<'_>,
+        ) -> Poll<std::io::Result<()>> {
+            if !self.failed {
+                self.failed = true;
+                return Poll::Ready(Err(std::io::Error::other("read failed")));
+            }
+
+            let n = self.data.len().min(buf.remaining());
+            buf.put_slice(&self.data[..n]);
+            self.data = &self.data[n..];
+            if n == 0 {
+                self.drained.store(true, Ordering::SeqCst);
+            }
+            Poll::Ready(Ok(()))
+        }
+    }
+
+    #[tokio::test]
+    async fn test_read_output_tail_drains_after_error() {
+        let drained = Arc::new(AtomicBool::new(false));
+        let reader = FailOnceReader {
+            failed: false,
+            data: b"line 1\nline 2\n",
+            drained: Arc::clone(&drained),
+        };
+
+        let tail = read_output_tail(Some(reader)).await;
+        assert!(tail.is_empty());
+        assert!(drained.load(Ordering::SeqCst));
+    }
+
+    #[tokio::test]
+    async fn test_extract_all_skips_bad_files() {
+        let bad = FileEntry::new(
+            "bad.ba2".to_string(),
+            100,
+            0,
+            "BadMod".to_string(),
+            PathBuf::from("/nonexistent/bad.ba2"),
+            true,
+        );
+
+        let result = extract_all(vec![bad], AppConfig::default(), None)
+            .await
+            .unwrap();
+
+        assert_eq!(result.successful, 0);
+        assert_eq!(result.failed, 0);
+        assert!(result.file_results.is_empty());
+    }
+
     #[tokio::test]
     async fn test_extract_ba2_file_not_found() {
         let result = extract_ba2_file(
@@ -166,7 +166,8 @@ pub fn normalize_separators(path: &str) -> String {
 ///
 /// `true` if the path exists and is a directory, `false` otherwise
 pub fn is_valid_directory(path: &Path) -> bool {
-    path.exists() && path.is_dir()
+    // `is_dir` is already `false` for missing paths, so one stat is enough
+    path.is_dir()
 }
 
 /// Check if a path is a valid file
@@ -179,7 +180,7 @@ pub fn is_valid_directory(path: &Path) -> bool {
 ///
 /// `true` if the path exists and is a file, `false` otherwise
 pub fn is_valid_file(path: &Path) -> bool {
-    path.exists() && path.is_file()
+    path.is_file()
 }
 
 /// Get the parent directory of a path
@@ -6,12 +6,13 @@
 //! be loaded by the game.
 
 use crate::ba2::BA2Header;
-use crate::config::AppConfig;
+use crate::config::{AppConfig, IgnoreMatcher};
 use crate::error::{Result, ValidationError};
 use crate::operations::BA2FileInfo;
 use rayon::prelude::*;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicUsize, Ordering};
 use tokio::sync::mpsc;
 use tracing::{debug, warn};
 
@@ -87,13 +88,11 @@ pub async fn scan_for_ba2(
 ) -> Result<Vec<BA2FileInfo>> {
     debug!("Starting BA2 scan in: {}", path.display());
 
-    // Verify the path exists and is a directory
-    if !path.exists() {
-        return Err(ValidationError::PathNotFound(path.to_path_buf()).into());
-    }
-
-    if !path.is_dir() {
-        return Err(ValidationError::NotADirectory(path.to_path_buf()).into());
+    // Verify the path exists and is a directory with a single stat
+    match fs::metadata(path) {
+        Ok(metadata) if metadata.is_dir() => {}
+        Ok(_) => return Err(ValidationError::NotADirectory(path.to_path_buf()).into()),
+        Err(_) => return Err(ValidationError::PathNotFound(path.to_path_buf()).into()),
     }
 
     // List all first-tier directories (mod folders)
@@ -108,11 +107,10 @@ pub async fn scan_for_ba2(
 
     for entry in entries {
         let entry = entry?;
-        let path = entry.path();
 
         // Skip files, only process directories
-        if path.is_dir() {
-            mod_folders.push(path);
+        if entry_is_dir(&entry) {
+            mod_folders.push(entry.path());
         }
     }
 
@@ -128,16 +126,52 @@ pub async fn scan_for_ba2(
             .await;
     }
 
-    // Use rayon for parallel scanning of mod folders
-    // Wrap in spawn_blocking to avoid blocking the async executor
-    // Note: Progress updates during parallel scanning are omitted to avoid
-    // tokio/rayon runtime conflicts. Only start and complete messages are sent.
-    let config_clone = config.clone();
+    // Use a bounded rayon pool for parallel scanning so the number of
+    // concurrently open archives stays under control
+    let workers = config.advanced.scan_workers();
+    debug!("Scanning with {} worker threads", workers);
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(workers)
+        .build()
+        .map_err(|e| std::io::Error::other(format!("Failed to create scan thread pool: {e}")))?;
+
+    // Wrap in spawn_blocking to avoid blocking the async executor.
+    // Per-folder progress is reported with `try_send`, which never blocks or
+    // touches the tokio runtime, so it is safe to call from rayon workers.
+    // Updates are dropped if the receiver falls behind.
+    let postfixes = lowercase_postfixes(&config.extraction.postfixes);
+    let ignore_matcher = config.ignore_matcher();
+    let folder_tx = progress_tx.clone();
     let all_ba2: Vec<BA2FileInfo> = tokio::task::spawn_blocking(move || {
-        mod_folders
-            .into_par_iter()
-            .flat_map(|mod_folder| scan_mod_folder(&mod_folder, &config_clone))
-            .collect()
+        let scanned = AtomicUsize::new(0);
+        pool.install(|| {
+            // Phase 1: list mod folders and select candidate BA2 files
+            let candidates: Vec<BA2Candidate> = mod_folders
+                .into_par_iter()
+                .flat_map(|mod_folder| {
+                    let candidates = scan_mod_folder(&mod_folder, &postfixes, &ignore_matcher);
+
+                    if let Some(ref tx) = folder_tx {
+                        let current = scanned.fetch_add(1, Ordering::Relaxed) + 1;
+                        let folder = mod_folder
+                            .file_name()
+                            .map(|n| n.to_string_lossy().into_owned())
+                            .unwrap_or_default();
+                        let _ = tx.try_send(ScanProgress::ScanningFolder {
+                            folder,
+                            current,
+                            total: total_folders,
+                        });
+                    }
+
+                    candidates
+                })
+                .collect();
+
+            // Phase 2: stat and parse headers per file rather than per folder,
+            // so a mod folder with many archives doesn't serialize on one worker
+            candidates.into_par_iter().map(probe_ba2).collect()
+        })
     })
     .await
     .map_err(|e| std::io::Error::other(format!("Scan task failed: {e}")))?;
@@ -155,9 +189,35 @@ pub async fn scan_for_ba2(
     Ok(all_ba2)
 }
 
-/// Scan a single mod folder for BA2 files
-fn scan_mod_folder(mod_folder: &Path, config: &AppConfig) -> Vec<BA2FileInfo> {
-    let mut ba2_files = Vec::new();
+/// A BA2 file selected for processing, before its header has been read
+#[derive(Debug)]
+struct BA2Candidate {
+    /// File name (without path)
+    file_name: String,
+    /// Parent directory name
+    dir_name: String,
+    /// Full path to the file
+    path: PathBuf,
+    /// File size in bytes, taken from the directory listing
+    file_size: u64,
+}
+
+/// Lowercase the configured postfixes once for case-insensitive matching
+fn lowercase_postfixes(postfixes: &[String]) -> Vec<String> {
+    postfixes.iter().map(|p| p.to_lowercase()).collect()
+}
+
+/// Scan a single mod folder for BA2 files matching the configured filters
+///
+/// `postfixes` must already be lowercased (see [`lowercase_postfixes`]).
+fn scan_mod_folder(
+    mod_folder: &Path,
+    postfixes: &[String],
+    ignore_matcher: &IgnoreMatcher,
+) -> Vec<BA2Candidate> {
+    let mut candidates = Vec::new();
+    let mut skipped_postfix = 0usize;
+    let mut skipped_ignored: Vec<String> = Vec::new();
 
     let dir_name = mod_folder
         .file_name()
@@ -170,7 +230,7 @@ fn scan_mod_folder(mod_folder: &Path, config: &AppConfig) -> Vec<BA2FileInfo> {
         Ok(entries) => entries,
         Err(e) => {
             warn!("Failed to read mod folder {}: {}", mod_folder.display(), e);
-            return ba2_files;
+            return candidates;
         }
     };
 
@@ -183,71 +243,124 @@ fn scan_mod_folder(mod_folder: &Path, config: &AppConfig) -> Vec<BA2FileInfo> {
             }
         };
 
-        let path = entry.path();
-
-        // Skip directories
-        if path.is_dir() {
+        // Filter on the entry's name first; the full path is only built for
+        // files that pass the cheap checks
+        let Ok(file_name) = entry.file_name().into_string() else {
             continue;
-        }
+        };
 
         // Only process .ba2 files
-        if path.extension().and_then(|e| e.to_str()) != Some("ba2") {
+        if Path::new(&file_name).extension().and_then(|e| e.to_str()) != Some("ba2") {
             continue;
         }
 
-        let file_name = match path.file_name().and_then(|n| n.to_str()) {
-            Some(name) => name.to_string(),
-            None => continue,
-        };
+        // Skip directories
+        if entry_is_dir(&entry) {
+            continue;
+        }
 
         // Check if file matches postfix patterns
         let file_name_lower = file_name.to_lowercase();
-        let matches_postfix = config
-            .extraction
-            .postfixes
+        let matches_postfix = postfixes
             .iter()
-            .any(|postfix| file_name_lower.contains(&postfix.to_lowercase()));
+            .any(|postfix| file_name_lower.contains(postfix.as_str()));
 
         if !matches_postfix {
-            debug!("Skipping {} (doesn't match postfix patterns)", file_name);
+            skipped_postfix += 1;
             continue;
         }
 
+        let path = entry.path();
+
         // Check if file should be ignored
-        if config.should_ignore_file(&path) {
-            debug!("Skipping {} (matches ignored pattern)", file_name);
+        if ignore_matcher.is_ignored(&path) {
+            skipped_ignored.push(file_name);
             continue;
         }
 
-        // Get file size
-        let file_size = match fs::metadata(&path) {
-            Ok(metadata) => metadata.len(),
+        let file_size = match entry_len(&entry, &path) {
+            Ok(len) => len,
             Err(e) => {
                 warn!("Failed to get metadata for {}: {}", path.display(), e);
                 0
             }
         };
 
-        // Try to read BA2 header to get file count and validate
-        let (num_files, is_bad) = match BA2Header::parse(&path) {
-            Ok(header) => (header.file_count, false),
-            Err(e) => {
-                warn!("Failed to parse BA2 header for {}: {}", path.display(), e);
-                (0, true)
-            }
-        };
-
-        ba2_files.push(BA2FileInfo {
+        candidates.push(BA2Candidate {
             file_name,
-            file_size,
-            num_files,
             dir_name: dir_name.clone(),
-            full_path: path,
-            is_bad,
+            path,
+            file_size,
         });
     }
 
-    ba2_files
+    // Skipped files are logged once per folder rather than once per file
+    if skipped_postfix > 0 {
+        debug!(
+            "Skipping {} files in {} (don't match postfix patterns)",
+            skipped_postfix, dir_name
+        );
+    }
+    if !skipped_ignored.is_empty() {
+        debug!(
+            "Skipping {} files in {} (match ignored patterns): {}",
+            skipped_ignored.len(),
+            dir_name,
+            skipped_ignored.join(", ")
+        );
+    }
+
+    candidates
+}
+
+/// Check whether a directory entry is a directory, following symlinks
+///
+/// Uses the file type returned with the directory listing, so only symlinks
+/// (and platforms that can't report the type) need an extra `stat` call.
+fn entry_is_dir(entry: &fs::DirEntry) -> bool {
+    match entry.file_type() {
+        Ok(file_type) if !file_type.is_symlink() => file_type.is_dir(),
+        _ => entry.path().is_dir(),
+    }
+}
+
+/// Get the size of a directory entry, following symlinks
+///
+/// Windows returns the metadata with the directory listing, so only symlinks
+/// need a separate `stat` call there.
+fn entry_len(entry: &fs::DirEntry, path: &Path) -> std::io::Result<u64> {
+    match entry.file_type() {
+        Ok(file_type) if !file_type.is_symlink() => entry.metadata().map(|m| m.len()),
+        _ => fs::metadata(path).map(|m| m.len()),
+    }
+}
+
+/// Read the header of a candidate BA2 file
+fn probe_ba2(candidate: BA2Candidate) -> BA2FileInfo {
+    let BA2Candidate {
+        file_name,
+        dir_name,
+        path,
+        file_size,
+    } = candidate;
+
+    // Try to read BA2 header to get file count and validate
+    let (num_files, is_bad) = match BA2Header::parse(&path) {
+        Ok(header) => (header.file_count, false),
+        Err(e) => {
+            warn!("Failed to parse BA2 header for {}: {}", path.display(), e);
+            (0, true)
+        }
+    };
+
+    BA2FileInfo {
+        file_name,
+        file_size,
+        num_files,
+        dir_name,
+        full_path: path,
+        is_bad,
+    }
 }
 
 #[cfg(test)]
@@ -386,12 +499,66 @@ mod tests {
         assert!(result.is_err());
     }
 
+    #[tokio::test]
+    async fn test_scan_file_path() {
+        let temp_dir = TempDir::new().unwrap();
+        let file_path = temp_dir.path().join("not_a_dir.ba2");
+        create_test_ba2(&file_path, 1);
+
+        let config = AppConfig::default();
+        let result = scan_for_ba2(&file_path, &config, None).await;
+        assert!(matches!(
+            result,
+            Err(crate::error::Error::Validation(
+                ValidationError::NotADirectory(_)
+            ))
+        ));
+    }
+
     #[test]
     fn test_scan_mod_folder_empty() {
         let temp_dir = TempDir::new().unwrap();
         let config = AppConfig::default();
 
-        let result = scan_mod_folder(temp_dir.path(), &config);
+        let postfixes = lowercase_postfixes(&config.extraction.postfixes);
+        let result = scan_mod_folder(temp_dir.path(), &postfixes, &config.ignore_matcher());
         assert_eq!(result.len(), 0);
     }
+
+    #[test]
+    fn test_scan_mod_folder_postfix_case_insensitive() {
+        let temp_dir = TempDir::new().unwrap();
+        create_test_ba2(&temp_dir.path().join("Mod - MAIN.ba2"), 1);
+        create_test_ba2(&temp_dir.path().join("Mod - Textures.ba2"), 1);
+
+        let postfixes = lowercase_postfixes(&["Main.ba2".to_string()]);
+        let result = scan_mod_folder(temp_dir.path(), &postfixes, &IgnoreMatcher::default());
+
+        assert_eq!(result.len(), 1);
+        assert_eq!(result[0].file_name, "Mod - MAIN.ba2");
+        assert_eq!(
+            result[0].file_size,
+            fs::metadata(&result[0].path).unwrap().len()
+        );
+    }
+
+    #[test]
+    fn test_probe_ba2_reads_header() {
+        let temp_dir = TempDir::new().unwrap();
+        let path = temp_dir.path().join("Probe_Main.ba2");
+        create_test_ba2(&path, 42);
+
+        let file_size = fs::metadata(&path).unwrap().len();
+        let info = probe_ba2(BA2Candidate {
+            file_name: "Probe_Main.ba2".to_string(),
+            dir_name: "ProbeMod".to_string(),
+            path,
+            file_size,
+        });
+
+        assert_eq!(info.num_files, 42);
+        assert_eq!(info.dir_name, "ProbeMod");
+        assert!(info.file_size > 0);
+        assert!(!info.is_bad);
+    }
 }
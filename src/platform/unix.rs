@@ -37,10 +37,7 @@ pub fn is_valid_executable(path: &std::path::Path) -> bool {
     {
         use std::os::unix::fs::PermissionsExt;
 
-        if !path.exists() {
-            return false;
-        }
-
+        // A missing file fails the metadata lookup, so no separate exists() check
         if let Ok(metadata) = std::fs::metadata(path) {
             let permissions = metadata.permissions();
             // Check if the file has execute permission for owner, group, or others
@@ -14,12 +14,26 @@ use crate::operations::{ExtractionProgress, ScanProgress, extract_all, scan_for_
 use anyhow::Result;
 use humansize::{BINARY, format_size};
 use parking_lot::Mutex;
-use slint::{ComponentHandle, Model, ModelRc, SharedString, VecModel};
+use slint::{ComponentHandle, Model, ModelRc, SharedString, Timer, TimerMode, VecModel};
+use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 use std::rc::Rc;
 use std::sync::Arc;
+use std::time::Duration;
 use tokio::sync::mpsc;
 
+/// Delay after the last threshold keystroke before the table is filtered
+const THRESHOLD_DEBOUNCE: Duration = Duration::from_millis(150);
+
+/// Number of BA2 files the auto-threshold keeps (the game's archive limit)
+const AUTO_THRESHOLD_FILE_LIMIT: usize = 235;
+
+/// Delay after the last ignored file before the config is saved
+const CONFIG_SAVE_DEBOUNCE: Duration = Duration::from_millis(500);
+
+/// Delay after the last settings edit before the config is updated and saved
+const SETTINGS_DEBOUNCE: Duration = Duration::from_millis(250);
+
 // Include the generated Slint code
 slint::include_modules!();
 
@@ -31,26 +45,41 @@ pub use notifications::{DialogConfig, ToastData, show_dialog, show_toast};
 /// This function creates the main window and runs the Slint event loop.
 /// It handles the integration between Slint's event loop and async operations.
 ///
+/// The configuration is passed in rather than loaded again, since `main`
+/// already reads it to set up logging.
+///
 /// # Example
 ///
 /// ```no_run
-/// use unpackrr::ui;
+/// use unpackrr::{config::AppConfig, ui};
 ///
 /// fn main() -> anyhow::Result<()> {
-///     ui::run()?;
+///     ui::run(AppConfig::load().unwrap_or_default())?;
 ///     Ok(())
 /// }
 /// ```
-pub fn run() -> Result<()> {
+pub fn run(config: AppConfig) -> Result<()> {
+    // Start the background runtime while the window is created, so the
+    // first scan doesn't spawn its worker threads on the UI thread
+    std::thread::spawn(|| {
+        crate::get_runtime();
+    });
+
     // Create the main window
     let main_window = MainWindow::new()?;
 
     // Set up callbacks and state (to be implemented in Phase 1.8)
-    setup_callbacks(&main_window);
+    let state = setup_callbacks(&main_window, config);
 
     // Run the Slint event loop
-    main_window.run()?;
+    let result = main_window.run();
+
+    // Write out changes whose debounced save hadn't fired yet, even if the
+    // event loop ended with an error
+    apply_pending_settings(&mut state.lock());
+    save_pending_config(&state);
 
+    result?;
     Ok(())
 }
 
@@ -61,17 +90,89 @@ struct AppState {
     file_entries: FileEntryList,
     sort_column: i32,
     sort_ascending: bool,
+    /// Size threshold the table is currently filtered by
+    applied_threshold: Option<u64>,
+    /// Config changes waiting for a debounced save
+    config_dirty: bool,
+    /// Latest edited value per settings key, not yet applied to the config
+    pending_settings: HashMap<String, String>,
 }
 
 impl AppState {
-    fn new() -> Result<Self> {
-        let config = AppConfig::load()?;
-        Ok(Self {
+    fn new(config: AppConfig) -> Self {
+        Self {
             config,
             file_entries: FileEntryList::new(),
             sort_column: -1,
             sort_ascending: true,
-        })
+            applied_threshold: None,
+            config_dirty: false,
+            pending_settings: HashMap::new(),
+        }
+    }
+}
+
+/// Map a file table row to the index of its entry
+///
+/// The table shows the entries in order, filtered by the threshold it was
+/// last built with, so row `n` is the `n`th entry within that threshold.
+fn entry_index_for_row(app_state: &AppState, row: usize) -> Option<usize> {
+    let threshold = app_state.applied_threshold;
+    app_state
+        .file_entries
+        .entries()
+        .iter()
+        .enumerate()
+        .filter(|(_, e)| threshold.is_none_or(|t| e.file_size() <= t))
+        .nth(row)
+        .map(|(idx, _)| idx)
+}
+
+/// Apply edited settings values to the config
+///
+/// Lists are replaced in one go, and edits that leave the parsed value
+/// unchanged (e.g. a trailing comma) don't mark the config for saving.
+fn apply_pending_settings(app_state: &mut AppState) {
+    let config = &mut app_state.config;
+    let mut changed = false;
+
+    for (key_str, value_str) in app_state.pending_settings.drain() {
+        tracing::info!("Setting changed: {} = {}", key_str, value_str);
+
+        changed |= match key_str.as_str() {
+            "postfixes" => replace_setting(
+                &mut config.extraction.postfixes,
+                parse_setting_list(&value_str),
+            ),
+            "ignored_files" => replace_setting(
+                &mut config.extraction.ignored_files,
+                parse_setting_list(&value_str),
+            ),
+            "theme_mode" => replace_setting(&mut config.appearance.theme_mode, value_str),
+            "language" => replace_setting(&mut config.appearance.language, value_str),
+            _ => {
+                tracing::warn!("Unknown setting key: {}", key_str);
+                false
+            }
+        };
+    }
+
+    app_state.config_dirty |= changed;
+}
+
+/// Save the configuration if changes are still waiting to be written
+///
+/// The changes stay pending if the save fails, so the next save (or the
+/// flush on exit) tries again.
+fn save_pending_config(state: &Mutex<AppState>) {
+    let mut app_state = state.lock();
+    if !app_state.config_dirty {
+        return;
+    }
+
+    match app_state.config.save() {
+        Ok(()) => app_state.config_dirty = false,
+        Err(e) => tracing::error!("Failed to save configuration: {}", e),
     }
 }
 
@@ -88,40 +189,85 @@ struct ExtractionControlState {
     control_tx: Option<tokio::sync::mpsc::UnboundedSender<ExtractionControl>>,
 }
 
+/// Progress panel values applied together with the status text, so each
+/// progress event reaches the UI in a single event loop callback
+struct ProgressDisplay {
+    file_name: String,
+    current: usize,
+    total: usize,
+    /// Speed and ETA text, only set when they should be refreshed
+    timing: Option<(String, String)>,
+}
+
+impl ProgressDisplay {
+    /// Values that reset the progress panel once extraction finishes
+    const fn cleared() -> Self {
+        Self {
+            file_name: String::new(),
+            current: 0,
+            total: 0,
+            timing: Some((String::new(), String::new())),
+        }
+    }
+
+    /// Push the progress values to the UI
+    fn apply(self, ui: &MainWindow) {
+        ui.set_current_extracting_file(SharedString::from(self.file_name));
+        ui.set_current_file_index(self.current.try_into().unwrap_or(i32::MAX));
+        ui.set_total_extraction_files(self.total.try_into().unwrap_or(i32::MAX));
+
+        // Calculate progress percentage (avoid division by zero)
+        let progress_pct = if self.total > 0 {
+            ((self.current * 100) / self.total).try_into().unwrap_or(0)
+        } else {
+            0
+        };
+        ui.set_extraction_progress(progress_pct);
+
+        // Phase 2.3: Update speed and ETA
+        if let Some((speed, eta)) = self.timing {
+            ui.set_extraction_speed(SharedString::from(speed));
+            ui.set_extraction_eta(SharedString::from(eta));
+        }
+    }
+}
+
 /// Set up UI callbacks
 ///
 /// This function wires up all the callbacks between the UI and backend logic.
 /// It handles folder selection, scanning, extraction, and sorting.
-fn setup_callbacks(main_window: &MainWindow) {
-    // Load application state
-    let state = match AppState::new() {
-        Ok(s) => Arc::new(Mutex::new(s)),
-        Err(e) => {
-            tracing::error!("Failed to load configuration: {}", e);
-            // Use default config if loading fails
-            Arc::new(Mutex::new(AppState {
-                config: AppConfig::default(),
-                file_entries: FileEntryList::new(),
-                sort_column: -1,
-                sort_ascending: true,
-            }))
-        }
-    };
+fn setup_callbacks(main_window: &MainWindow, config: AppConfig) -> Arc<Mutex<AppState>> {
+    // Application state starts from the configuration loaded at startup
+    let state = Arc::new(Mutex::new(AppState::new(config)));
 
     // Phase 2.3: Create extraction control state
     let extraction_control = Arc::new(Mutex::new(ExtractionControlState { control_tx: None }));
 
-    // Initialize theme from config
+    // Initialize theme from config; the theme styles are compiled into the
+    // UI, so only the mode index needs resolving
     {
-        let config_theme = state.lock().config.appearance.theme_mode.clone();
-        let theme_mode = match config_theme.to_lowercase().as_str() {
-            "dark" => 1,
-            "light" => 0,
-            _ => 2, // System
+        let app_state = state.lock();
+        let config_theme = app_state.config.appearance.theme_mode.as_str();
+        let theme_mode = if config_theme.eq_ignore_ascii_case("dark") {
+            1
+        } else if config_theme.eq_ignore_ascii_case("light") {
+            0
+        } else {
+            2 // System
         };
+        drop(app_state);
         main_window.set_theme_mode(theme_mode);
     }
 
+    // Fill the list settings from config so edits start from saved values
+    {
+        let app_state = state.lock();
+        let extraction = &app_state.config.extraction;
+        main_window.set_settings_postfixes(format_setting_list(&extraction.postfixes).into());
+        main_window
+            .set_settings_ignored_files(format_setting_list(&extraction.ignored_files).into());
+    }
+
     setup_browse_folder_callback(main_window, Arc::clone(&state));
     setup_scan_callback(main_window, Arc::clone(&state));
     setup_extraction_callback(
@@ -140,6 +286,8 @@ fn setup_callbacks(main_window: &MainWindow) {
     setup_log_viewer_callbacks(main_window); // Phase 3.3
 
     tracing::info!("UI callbacks initialized");
+
+    state
 }
 
 /// Set up browse folder callback
@@ -154,26 +302,26 @@ fn setup_browse_folder_callback(main_window: &MainWindow, state: Arc<Mutex<AppSt
         std::thread::spawn(move || {
             tracing::debug!("Opening folder picker dialog");
             if let Some(folder) = rfd::FileDialog::new().pick_folder() {
-                let folder_str = folder.to_string_lossy().to_string();
+                let folder_str = folder.to_string_lossy().into_owned();
                 tracing::info!("User selected folder: {}", folder_str);
+                let folder_text = SharedString::from(folder_str.as_str());
 
                 // Update UI on main thread
                 let _ = slint::invoke_from_event_loop(move || {
                     if let Some(ui) = weak_clone.upgrade() {
-                        ui.set_selected_folder(SharedString::from(folder_str.clone()));
-
-                        // Save last used directory
-                        {
-                            let mut app_state = state.lock();
-                            app_state.config.saved.directory.clone_from(&folder_str);
-                            if let Err(e) = app_state.config.save() {
-                                tracing::error!("Failed to save configuration: {}", e);
-                            } else {
-                                tracing::debug!("Saved last used directory to config");
-                            }
-                        }
+                        ui.set_selected_folder(folder_text);
                     }
                 });
+
+                // Save last used directory from this thread so the file write
+                // stays off the UI thread; the path is moved, not copied again
+                let mut app_state = state.lock();
+                app_state.config.saved.directory = folder_str;
+                if let Err(e) = app_state.config.save() {
+                    tracing::error!("Failed to save configuration: {}", e);
+                } else {
+                    tracing::debug!("Saved last used directory to config");
+                }
             } else {
                 tracing::debug!("Folder picker canceled by user");
             }
@@ -190,13 +338,13 @@ fn setup_scan_callback(main_window: &MainWindow, state: Arc<Mutex<AppState>>) {
         let weak_clone = weak.clone();
         let state_clone = Arc::clone(&state);
 
-        // Get selected folder from UI
-        let folder = if let Some(ui) = weak.upgrade() {
-            ui.get_selected_folder().to_string()
-        } else {
+        let Some(ui) = weak.upgrade() else {
             return;
         };
 
+        // Get selected folder from UI
+        let folder = ui.get_selected_folder().to_string();
+
         if folder.is_empty() {
             tracing::warn!("Scan requested but no folder selected");
             return;
@@ -205,10 +353,8 @@ fn setup_scan_callback(main_window: &MainWindow, state: Arc<Mutex<AppState>>) {
         tracing::info!("Starting BA2 scan in: {}", folder);
 
         // Set scanning state
-        if let Some(ui) = weak.upgrade() {
-            ui.set_scanning(true);
-            ui.set_status_text(SharedString::from("Scanning for BA2 files..."));
-        }
+        ui.set_scanning(true);
+        ui.set_status_text(SharedString::from("Scanning for BA2 files..."));
 
         // Run scan in background task using global runtime
         crate::get_runtime().spawn(async move {
@@ -245,7 +391,11 @@ fn setup_scan_callback(main_window: &MainWindow, state: Arc<Mutex<AppState>>) {
                         format!("Found: {file_name}")
                     }
                     ScanProgress::Complete { total_files } => {
-                        format!("Scan complete: {total_files} files found")
+                        // The scan result handler below sets the final status
+                        // and table together, so don't queue a status text
+                        // that it would overwrite straight away
+                        tracing::debug!("Scan complete: {} files found", total_files);
+                        continue;
                     }
                 };
 
@@ -260,7 +410,20 @@ fn setup_scan_callback(main_window: &MainWindow, state: Arc<Mutex<AppState>>) {
             match scan_task.await {
                 Ok(Ok(files)) => {
                     let total_files = files.len();
-                    let total_size = files.iter().map(|f| f.file_size).sum::<u64>();
+
+                    // Convert to FileEntry and FileRowData in a single pass,
+                    // collecting the totals along the way
+                    let mut entries: Vec<FileEntry> = Vec::with_capacity(total_files);
+                    let mut row_data: Vec<FileRowData> = Vec::with_capacity(total_files);
+                    let mut total_size: u64 = 0;
+                    let mut corrupted_count = 0usize;
+                    for file in files {
+                        let entry = FileEntry::from(file);
+                        total_size += entry.file_size();
+                        corrupted_count += usize::from(entry.is_corrupted());
+                        row_data.push(FileRowData::from(&entry));
+                        entries.push(entry);
+                    }
 
                     tracing::info!(
                         "Scan complete: found {} BA2 files, total size: {} bytes",
@@ -268,36 +431,21 @@ fn setup_scan_callback(main_window: &MainWindow, state: Arc<Mutex<AppState>>) {
                         total_size
                     );
 
-                    // Convert to FileEntry and store in state
-                    let entries: Vec<FileEntry> = files.into_iter().map(FileEntry::from).collect();
-
-                    let corrupted_count = entries.iter().filter(|e| e.is_corrupted()).count();
                     if corrupted_count > 0 {
                         tracing::warn!("Found {} corrupted BA2 files", corrupted_count);
                     }
 
-                    // Convert to FileRowData for UI
-                    let row_data: Vec<FileRowData> = entries
-                        .iter()
-                        .map(|e| FileRowData {
-                            file_name: SharedString::from(&e.file_name),
-                            file_size: SharedString::from(e.size_display()),
-                            num_files: SharedString::from(e.file_count_display()),
-                            mod_name: SharedString::from(e.mod_display()),
-                            is_bad: e.is_corrupted(),
-                        })
-                        .collect();
-
                     // Update state
                     {
                         let mut app_state = state_clone.lock();
                         app_state.file_entries = FileEntryList::from_vec(entries);
+                        app_state.applied_threshold = None;
                     }
 
                     // Update UI
                     let _ = slint::invoke_from_event_loop(move || {
                         if let Some(ui) = weak_clone.upgrade() {
-                            ui.set_file_list(ModelRc::new(VecModel::from(row_data)));
+                            set_file_rows(&ui, row_data);
                             ui.set_total_files(total_files.try_into().unwrap_or(i32::MAX));
                             ui.set_total_size(SharedString::from(format_size(total_size, BINARY)));
                             ui.set_scanning(false);
@@ -439,14 +587,13 @@ fn setup_extraction_callback(
                             }
 
                     let weak = weak_clone.clone();
-                    let status = match &progress {  // Changed to &progress to avoid move
+                    let (status, display) = match &progress {  // Changed to &progress to avoid move
                         ExtractionProgress::Started {
                             file_name,
                             current,
                             total,
                         } => {
                             // Phase 2.3: Update progress properties in UI
-                            let file_name_clone = file_name.clone();
                             let current_val = *current;
                             let total_val = *total;
 
@@ -501,37 +648,21 @@ fn setup_extraction_callback(
                                 String::new()
                             };
 
-                            let weak_progress = weak.clone();
-                            let _ = slint::invoke_from_event_loop(move || {
-                                if let Some(ui) = weak_progress.upgrade() {
-                                    ui.set_current_extracting_file(SharedString::from(file_name_clone));
-                                    ui.set_current_file_index(current_val.try_into().unwrap_or(i32::MAX));
-                                    ui.set_total_extraction_files(total_val.try_into().unwrap_or(i32::MAX));
-
-                                    // Calculate progress percentage (avoid division by zero)
-                                    let progress_pct = if total_val > 0 {
-                                        ((current_val * 100) / total_val).try_into().unwrap_or(0)
-                                    } else {
-                                        0
-                                    };
-                                    ui.set_extraction_progress(progress_pct);
-
-                                    // Phase 2.3: Update speed and ETA
-                                    if should_update_timing {
-                                        ui.set_extraction_speed(SharedString::from(speed_str));
-                                        ui.set_extraction_eta(SharedString::from(eta_str));
-                                    }
-                                }
-                            });
+                            let display = ProgressDisplay {
+                                file_name: file_name.clone(),
+                                current: current_val,
+                                total: total_val,
+                                timing: should_update_timing.then_some((speed_str, eta_str)),
+                            };
 
-                            format!("Extracting {file_name} ({current}/{total})")
+                            (format!("Extracting {file_name} ({current}/{total})"), Some(display))
                         }
                         ExtractionProgress::Completed {
                             file_name,
                             success,
                             error,
                         } => {
-                            if *success {  // Dereference since we're now matching on &progress
+                            let status = if *success {  // Dereference since we're now matching on &progress
                                 format!("Completed: {file_name}")
                             } else {
                                 format!(
@@ -539,33 +670,27 @@ fn setup_extraction_callback(
                                     file_name,
                                     error.as_ref().map_or("Unknown error", std::string::String::as_str)
                                 )
-                            }
+                            };
+                            (status, None)
                         }
                         ExtractionProgress::Finished {
                             successful,
                             failed,
                         } => {
                             // Phase 2.3: Reset progress properties
-                            let weak_progress = weak.clone();
-                            let _ = slint::invoke_from_event_loop(move || {
-                                if let Some(ui) = weak_progress.upgrade() {
-                                    ui.set_current_extracting_file(SharedString::from(""));
-                                    ui.set_current_file_index(0);
-                                    ui.set_total_extraction_files(0);
-                                    ui.set_extraction_progress(0);
-                                    ui.set_extraction_speed(SharedString::from("")); // Phase 2.3: Reset speed
-                                    ui.set_extraction_eta(SharedString::from("")); // Phase 2.3: Reset ETA
-                                }
-                            });
-
-                            format!(
-                                "Extraction complete: {successful} successful, {failed} failed"
+                            (
+                                format!("Extraction complete: {successful} successful, {failed} failed"),
+                                Some(ProgressDisplay::cleared()),
                             )
                         }
                     };
 
+                    // Progress and status go out together in one UI update
                     let _ = slint::invoke_from_event_loop(move || {
                         if let Some(ui) = weak.upgrade() {
+                            if let Some(display) = display {
+                                display.apply(&ui);
+                            }
                             ui.set_status_text(SharedString::from(status));
                         }
                     });
@@ -722,40 +847,28 @@ fn setup_sort_callback(main_window: &MainWindow, state: Arc<Mutex<AppState>>) {
             (ascending, !ascending)
         };
 
-        // Sort entries in state
-        {
+        // Sort entries in state and build the rows under the same lock
+        let row_data: Vec<FileRowData> = {
             let mut app_state = state.lock();
             app_state.file_entries.sort_by(sort_by, reverse);
-        }
-
-        // Update UI
-        let state_clone = Arc::clone(&state);
-        let weak_clone = weak.clone();
-        let _ = slint::invoke_from_event_loop(move || {
-            if let Some(ui) = weak_clone.upgrade() {
-                // Update sort indicators
-                ui.set_sort_column(column);
-                ui.set_sort_ascending(new_ascending);
+            // Sorting shows every entry again
+            app_state.applied_threshold = None;
+            app_state
+                .file_entries
+                .entries()
+                .iter()
+                .map(FileRowData::from)
+                .collect()
+        }; // Lock dropped here before UI update
 
-                let row_data: Vec<FileRowData> = {
-                    let app_state = state_clone.lock();
-                    app_state
-                        .file_entries
-                        .entries()
-                        .iter()
-                        .map(|e| FileRowData {
-                            file_name: SharedString::from(&e.file_name),
-                            file_size: SharedString::from(e.size_display()),
-                            num_files: SharedString::from(e.file_count_display()),
-                            mod_name: SharedString::from(e.mod_display()),
-                            is_bad: e.is_corrupted(),
-                        })
-                        .collect()
-                }; // Lock dropped here before UI update
-
-                ui.set_file_list(ModelRc::new(VecModel::from(row_data)));
-            }
-        });
+        // Callbacks already run on the UI thread, so update the table directly
+        // instead of queueing another event loop hop
+        if let Some(ui) = weak.upgrade() {
+            // Update sort indicators
+            ui.set_sort_column(column);
+            ui.set_sort_ascending(new_ascending);
+            set_file_rows(&ui, row_data);
+        }
     });
 }
 
@@ -842,12 +955,16 @@ fn setup_update_checker_callback(main_window: &MainWindow) {
                             update_info.latest_version
                         );
 
-                        let download_url = update_info.download_url.clone();
+                        let download_url = update_info.download_url;
 
-                        // Open the download page in the browser immediately
-                        if let Err(e) = open::that(&download_url) {
-                            tracing::error!("Failed to open browser: {}", e);
-                        }
+                        // Open the download page in the browser immediately.
+                        // Launching the browser can block until the opener
+                        // exits, so keep it off the async worker threads.
+                        tokio::task::spawn_blocking(move || {
+                            if let Err(e) = open::that(&download_url) {
+                                tracing::error!("Failed to open browser: {}", e);
+                            }
+                        });
 
                         let message = format!(
                             "Update available!\n\nCurrent version: {}\nLatest version: {}\n\nOpening download page in your browser...\n\n{}",
@@ -926,37 +1043,30 @@ fn setup_threshold_callbacks(main_window: &MainWindow, state: &Arc<Mutex<AppStat
         let state_clone = Arc::clone(state);
         let weak_clone = weak.clone();
 
-        main_window.on_threshold_changed(move |value| {
-            let value_str = value.to_string();
-
-            if value_str.is_empty() {
-                // Clear threshold - show all files
-                let weak = weak_clone.clone();
-                let state = Arc::clone(&state_clone);
-                let _ = slint::invoke_from_event_loop(move || {
-                    if let Some(ui) = weak.upgrade() {
-                        refresh_file_table(&ui, &state, None);
-                    }
-                });
-                return;
-            }
+        // The input fires on every keystroke; only rebuild the table once
+        // typing pauses. Restarting the timer drops the pending update.
+        let debounce = Rc::new(Timer::default());
 
-            // Parse the threshold value
-            match crate::operations::parse_size(&value_str) {
-                Ok(threshold_bytes) => {
-                    tracing::info!("Threshold set to: {} bytes", threshold_bytes);
+        let debounce_for_edits = Rc::clone(&debounce);
+        main_window.on_threshold_changed(move |value| {
+            let weak = weak_clone.clone();
+            let state = Arc::clone(&state_clone);
 
-                    let weak = weak_clone.clone();
-                    let state = Arc::clone(&state_clone);
-                    let _ = slint::invoke_from_event_loop(move || {
-                        if let Some(ui) = weak.upgrade() {
-                            refresh_file_table(&ui, &state, Some(threshold_bytes));
-                        }
-                    });
-                }
-                Err(e) => {
-                    tracing::warn!("Invalid threshold value '{}': {}", value_str, e);
+            debounce_for_edits.start(TimerMode::SingleShot, THRESHOLD_DEBOUNCE, move || {
+                if let Some(ui) = weak.upgrade() {
+                    apply_threshold_value(&ui, &state, &value);
                 }
+            });
+        });
+
+        // Pressing Enter applies the value right away, replacing any
+        // update still waiting on the debounce
+        let state_clone = Arc::clone(state);
+        let weak_clone = weak.clone();
+        main_window.on_threshold_accepted(move |value| {
+            debounce.stop();
+            if let Some(ui) = weak_clone.upgrade() {
+                apply_threshold_value(&ui, &state_clone, &value);
             }
         });
     }
@@ -969,24 +1079,21 @@ fn setup_threshold_callbacks(main_window: &MainWindow, state: &Arc<Mutex<AppStat
         #[allow(clippy::significant_drop_tightening)] // Lock must be held while reading entries
         main_window.on_auto_threshold_toggled(move |enabled| {
             if enabled {
-                // Calculate auto-threshold (235 file limit)
+                // Calculate auto-threshold (BA2 file limit)
                 let (entries_count, threshold_opt) = {
                     let app_state = state_clone.lock();
-                    let entries = app_state.file_entries.entries();
-                    let count = entries.len();
+                    let count = app_state.file_entries.len();
 
-                    if count <= 235 {
+                    if count <= AUTO_THRESHOLD_FILE_LIMIT {
                         (count, None)
                     } else {
-                        // Get the 235th largest file's size
-                        let mut sorted_sizes: Vec<u64> = entries.iter()
-                            .map(|e| e.file_size)
-                            .collect();
-                        sorted_sizes.sort_unstable();
-                        sorted_sizes.reverse();
-
-                        let threshold = sorted_sizes[234]; // 0-indexed, so 234 is the 235th item
-                        (count, Some(threshold))
+                        // Get the limit-th largest file's size from the cached sorted sizes
+                        (
+                            count,
+                            app_state
+                                .file_entries
+                                .nth_largest_size(AUTO_THRESHOLD_FILE_LIMIT),
+                        )
                     }
                 };
 
@@ -994,136 +1101,176 @@ fn setup_threshold_callbacks(main_window: &MainWindow, state: &Arc<Mutex<AppStat
                     let threshold_str = format_size(threshold, BINARY);
 
                     tracing::info!(
-                        "Auto-threshold calculated: {} ({} bytes) - will keep 235 files",
+                        "Auto-threshold calculated: {} ({} bytes) - will keep {} files",
                         threshold_str,
-                        threshold
+                        threshold,
+                        AUTO_THRESHOLD_FILE_LIMIT
                     );
 
-                    let weak = weak_clone.clone();
-                    let state = Arc::clone(&state_clone);
-                    let _ = slint::invoke_from_event_loop(move || {
-                        if let Some(ui) = weak.upgrade() {
-                            ui.set_threshold_value(SharedString::from(threshold_str.clone()));
-                            refresh_file_table(&ui, &state, Some(threshold));
-
-                            show_toast(&ui, &ToastData {
-                                message: format!(
-                                    "Auto-threshold set to {threshold_str} (keeping 235 files)"
-                                ),
-                                notification_type: NotificationType::Success,
-                                show: true,
-                            });
-                        }
-                    });
+                    // Toggle callbacks run on the UI thread, so update it directly
+                    if let Some(ui) = weak_clone.upgrade() {
+                        ui.set_threshold_value(SharedString::from(threshold_str.as_str()));
+                        refresh_file_table(&ui, &state_clone, Some(threshold));
+
+                        show_toast(&ui, &ToastData {
+                            message: format!(
+                                "Auto-threshold set to {threshold_str} (keeping {AUTO_THRESHOLD_FILE_LIMIT} files)"
+                            ),
+                            notification_type: NotificationType::Success,
+                            show: true,
+                        });
+                    }
                 } else {
                     tracing::info!("Auto-threshold not needed: only {} files", entries_count);
 
-                    let weak = weak_clone.clone();
-                    let _ = slint::invoke_from_event_loop(move || {
-                        if let Some(ui) = weak.upgrade() {
-                            ui.set_auto_threshold(false);
-                            show_toast(&ui, &ToastData {
-                                message: format!(
-                                    "Auto-threshold not needed: only {entries_count} BA2 files found (limit is 235)"
-                                ),
-                                notification_type: NotificationType::Info,
-                                show: true,
-                            });
-                        }
-                    });
+                    if let Some(ui) = weak_clone.upgrade() {
+                        ui.set_auto_threshold(false);
+                        show_toast(&ui, &ToastData {
+                            message: format!(
+                                "Auto-threshold not needed: only {entries_count} BA2 files found (limit is {AUTO_THRESHOLD_FILE_LIMIT})"
+                            ),
+                            notification_type: NotificationType::Info,
+                            show: true,
+                        });
+                    }
                 }
-            } else {
+            } else if let Some(ui) = weak_clone.upgrade() {
                 // Auto-threshold disabled - clear threshold
-                let weak = weak_clone.clone();
-                let state = Arc::clone(&state_clone);
-                let _ = slint::invoke_from_event_loop(move || {
-                    if let Some(ui) = weak.upgrade() {
-                        ui.set_threshold_value(SharedString::from(""));
-                        refresh_file_table(&ui, &state, None);
-                    }
-                });
+                ui.set_threshold_value(SharedString::from(""));
+                refresh_file_table(&ui, &state_clone, None);
             }
         });
     }
 }
 
+/// Parse a threshold input value and filter the file table with it
+///
+/// An empty value clears the threshold; invalid values are logged and leave
+/// the table unchanged. Edits that parse to the threshold already applied
+/// (e.g. "1 GiB" retyped as "1GiB") skip the rebuild.
+fn apply_threshold_value(ui: &MainWindow, state: &Arc<Mutex<AppState>>, value: &str) {
+    let threshold = if value.is_empty() {
+        // Clear threshold - show all files
+        None
+    } else {
+        // Parse the threshold value
+        match crate::operations::parse_size(value) {
+            Ok(threshold_bytes) => Some(threshold_bytes),
+            Err(e) => {
+                tracing::warn!("Invalid threshold value '{}': {}", value, e);
+                return;
+            }
+        }
+    };
+
+    if state.lock().applied_threshold == threshold {
+        return;
+    }
+
+    if let Some(threshold_bytes) = threshold {
+        tracing::info!("Threshold set to: {} bytes", threshold_bytes);
+    }
+    refresh_file_table(ui, state, threshold);
+}
+
 /// Set up file actions callback (Phase 2.3 - ignore/open)
 #[allow(clippy::too_many_lines)] // Multiple file action handlers
 fn setup_file_actions_callback(main_window: &MainWindow, state: &Arc<Mutex<AppState>>) {
     let weak = main_window.as_weak();
     let state = Arc::clone(state);
 
+    let save_debounce = Timer::default();
+
     main_window.on_file_action(move |row_index, action| {
         let action_str = action.to_string();
         tracing::info!("File action requested: {} for row {}", action_str, row_index);
 
+        // File actions run on the UI thread; upgrade the handle once and
+        // use it for the whole action
+        let Some(ui) = weak.upgrade() else {
+            return;
+        };
+
         match action_str.as_str() {
             "ignore" => {
-                // Get the file name from the row
-                let file_name = if let Some(ui) = weak.upgrade() {
-                    let file_list = ui.get_file_list();
-                    if let Ok(idx) = usize::try_from(row_index) {
-                        if idx < file_list.row_count() {
-                            file_list.row_data(idx).unwrap().file_name.to_string()
-                        } else {
-                            tracing::error!("Invalid row index: {}", row_index);
-                            return;
-                        }
-                    } else {
+                // Remove only the clicked entry and add its path to the
+                // ignored files in config; other mods may ship an archive
+                // with the same name
+                let (file_name, config_changed, threshold, ignored_text) = {
+                    let mut app_state = state.lock();
+                    let Some(idx) = usize::try_from(row_index)
+                        .ok()
+                        .and_then(|row| entry_index_for_row(&app_state, row))
+                    else {
                         tracing::error!("Invalid row index: {}", row_index);
                         return;
+                    };
+                    let Some(entry) = app_state.file_entries.remove(idx) else {
+                        return;
+                    };
+                    tracing::info!("Ignoring file: {}", entry.full_path.display());
+
+                    // Apply any unsaved edits to the settings first so the
+                    // field below doesn't overwrite them
+                    apply_pending_settings(&mut app_state);
+
+                    // Only append the path if it isn't ignored yet
+                    let path = entry.full_path.to_string_lossy().into_owned();
+                    let ignored_files = &mut app_state.config.extraction.ignored_files;
+                    let added = !ignored_files.contains(&path);
+                    if added {
+                        ignored_files.push(path);
                     }
-                } else {
-                    return;
+                    let ignored_text = format_setting_list(ignored_files);
+
+                    app_state.config_dirty |= added;
+                    (
+                        entry.name_display().to_owned(),
+                        added,
+                        app_state.applied_threshold,
+                        ignored_text,
+                    )
                 };
 
-                tracing::info!("Ignoring file: {}", file_name);
+                // Keep the settings field in step with the ignored files
+                ui.set_settings_ignored_files(ignored_text.into());
 
-                // Add to ignored files in config
-                {
-                    let mut app_state = state.lock();
-                    // TODO: Add the file to the ignored list in config
-                    // For now, just remove it from the current list
-                    let entries = app_state.file_entries.entries().to_vec();
-                    let filtered: Vec<FileEntry> = entries
-                        .into_iter()
-                        .filter(|e| e.file_name != file_name)
-                        .collect();
-                    app_state.file_entries = FileEntryList::from_vec(filtered);
+                // Ignoring several files in a row results in one write of
+                // the config once the clicks stop
+                if config_changed {
+                    let state = Arc::clone(&state);
+                    save_debounce.start(TimerMode::SingleShot, CONFIG_SAVE_DEBOUNCE, move || {
+                        let state = Arc::clone(&state);
+                        std::thread::spawn(move || save_pending_config(&state));
+                    });
                 }
 
-                // Refresh the table
-                let weak_clone = weak.clone();
-                let state_clone = Arc::clone(&state);
-                let _ = slint::invoke_from_event_loop(move || {
-                    if let Some(ui) = weak_clone.upgrade() {
-                        refresh_file_table(&ui, &state_clone, None);
+                // Refresh the table, keeping the current threshold filter
+                refresh_file_table(&ui, &state, threshold);
 
-                        show_toast(&ui, &ToastData {
-                            message: format!("Ignored file: {file_name}"),
-                            notification_type: NotificationType::Success,
-                            show: true,
-                        });
-                    }
+                show_toast(&ui, &ToastData {
+                    message: format!("Ignored file: {file_name}"),
+                    notification_type: NotificationType::Success,
+                    show: true,
                 });
             }
             "open" => {
                 // Get the file info from state
                 let (file_name, file_path, ext_tool_path) = {
                     let app_state = state.lock();
-                    let entries = app_state.file_entries.entries();
-
-                    let idx = match usize::try_from(row_index) {
-                        Ok(i) if i < entries.len() => i,
-                        _ => {
-                            tracing::error!("Invalid row index: {}", row_index);
-                            return;
-                        }
+                    // Rows are filtered by the threshold, so map the row
+                    // back to its entry the same way "ignore" does
+                    let Some(idx) = usize::try_from(row_index)
+                        .ok()
+                        .and_then(|row| entry_index_for_row(&app_state, row))
+                    else {
+                        tracing::error!("Invalid row index: {}", row_index);
+                        return;
                     };
 
-                    let entry = &entries[idx];
+                    let entry = &app_state.file_entries.entries()[idx];
                     (
-                        entry.file_name.clone(),
+                        entry.name_display().to_owned(),
                         entry.full_path.clone(),
                         app_state.config.advanced.ext_ba2_exe.clone(),
                     )
@@ -1132,17 +1279,12 @@ fn setup_file_actions_callback(main_window: &MainWindow, state: &Arc<Mutex<AppSt
                 tracing::info!("Opening BA2 file with external tool: {}", file_path.display());
 
                 // Check if file exists
-                if !file_path.exists() {
+                if !file_path.is_file() {
                     tracing::error!("File not found: {}", file_path.display());
-                    let weak_clone = weak.clone();
-                    let _ = slint::invoke_from_event_loop(move || {
-                        if let Some(ui) = weak_clone.upgrade() {
-                            show_toast(&ui, &ToastData {
-                                message: format!("File not found: {file_name}"),
-                                notification_type: NotificationType::Error,
-                                show: true,
-                            });
-                        }
+                    show_toast(&ui, &ToastData {
+                        message: format!("File not found: {file_name}"),
+                        notification_type: NotificationType::Error,
+                        show: true,
                     });
                     return;
                 }
@@ -1150,48 +1292,34 @@ fn setup_file_actions_callback(main_window: &MainWindow, state: &Arc<Mutex<AppSt
                 // Check if external tool is configured
                 if ext_tool_path.is_empty() {
                     tracing::warn!("No external BA2 tool configured");
-                    let weak_clone = weak.clone();
-                    let _ = slint::invoke_from_event_loop(move || {
-                        if let Some(ui) = weak_clone.upgrade() {
-                            show_toast(&ui, &ToastData {
-                                message: "No external BA2 tool configured.\nPlease set the tool path in Settings > Advanced.".to_string(),
-                                notification_type: NotificationType::Warning,
-                                show: true,
-                            });
-                        }
+                    show_toast(&ui, &ToastData {
+                        message: "No external BA2 tool configured.\nPlease set the tool path in Settings > Advanced.".to_string(),
+                        notification_type: NotificationType::Warning,
+                        show: true,
                     });
                     return;
                 }
 
-                // Launch external tool in background thread
-                let weak_clone = weak.clone();
-                std::thread::spawn(move || {
-                    use std::process::Command;
-
-                    tracing::info!("Launching: {} {}", ext_tool_path, file_path.display());
+                // Launch the external tool detached; spawning returns as soon
+                // as the process starts, so no helper thread is needed
+                tracing::info!("Launching: {} {}", ext_tool_path, file_path.display());
 
-                    match Command::new(&ext_tool_path)
-                        .arg(&file_path)
-                        .spawn()
-                    {
-                        Ok(_) => {
-                            tracing::info!("Successfully launched external tool for {}", file_name);
-                        }
-                        Err(e) => {
-                            tracing::error!("Failed to launch external tool: {}", e);
-                            let error_msg = format!("Failed to open BA2 file:\n{e}");
-                            let _ = slint::invoke_from_event_loop(move || {
-                                if let Some(ui) = weak_clone.upgrade() {
-                                    show_toast(&ui, &ToastData {
-                                        message: error_msg,
-                                        notification_type: NotificationType::Error,
-                                        show: true,
-                                    });
-                                }
-                            });
-                        }
+                match std::process::Command::new(&ext_tool_path)
+                    .arg(&file_path)
+                    .spawn()
+                {
+                    Ok(_) => {
+                        tracing::info!("Successfully launched external tool for {}", file_name);
                     }
-                });
+                    Err(e) => {
+                        tracing::error!("Failed to launch external tool: {}", e);
+                        show_toast(&ui, &ToastData {
+                            message: format!("Failed to open BA2 file:\n{e}"),
+                            notification_type: NotificationType::Error,
+                            show: true,
+                        });
+                    }
+                }
             }
             _ => {
                 tracing::warn!("Unknown file action: {}", action_str);
@@ -1266,44 +1394,72 @@ fn setup_open_folder_callback(main_window: &MainWindow, state: Arc<Mutex<AppStat
     });
 }
 
+/// Build a table row from a file entry
+///
+/// Shared by every place that fills the file table, so each column is
+/// produced the same way and without intermediate strings.
+impl From<&FileEntry> for FileRowData {
+    fn from(entry: &FileEntry) -> Self {
+        Self {
+            file_name: SharedString::from(entry.name_display()),
+            file_size: SharedString::from(entry.size_display()),
+            num_files: slint::format!("{}", entry.num_files),
+            mod_name: SharedString::from(entry.mod_display()),
+            is_bad: entry.is_corrupted(),
+        }
+    }
+}
+
+/// Replace the rows shown in the file table
+///
+/// Reuses the window's existing `VecModel`, so the table gets a single reset
+/// notification instead of a brand-new model to track. The first call
+/// installs the model.
+fn set_file_rows(ui: &MainWindow, rows: Vec<FileRowData>) {
+    let file_list = ui.get_file_list();
+    if let Some(model) = file_list.as_any().downcast_ref::<VecModel<FileRowData>>() {
+        model.set_vec(rows);
+    } else {
+        ui.set_file_list(ModelRc::new(VecModel::from(rows)));
+    }
+}
+
 /// Refresh the file table with optional threshold filtering (Phase 2.3)
 fn refresh_file_table(ui: &MainWindow, state: &Arc<Mutex<AppState>>, threshold: Option<u64>) {
-    let entries = {
-        let app_state = state.lock();
-        app_state.file_entries.entries().to_vec()
-    };
-
-    // Filter by threshold if provided
-    let filtered_entries: Vec<&FileEntry> = threshold.map_or_else(
-        || entries.iter().collect(),
-        |threshold_bytes| {
-            entries
+    // Build rows straight from the shared entries instead of cloning the
+    // whole list first; only the displayed columns are copied
+    let (row_data, total_size) = {
+        let mut app_state = state.lock();
+        app_state.applied_threshold = threshold;
+        let file_entries = &app_state.file_entries;
+
+        // The entry count bounds the shown rows, so the rows are allocated
+        // once without sorting sizes just to count them
+        let mut row_data: Vec<FileRowData> = Vec::with_capacity(file_entries.len());
+        let mut total_size: u64 = 0;
+        row_data.extend(
+            file_entries
+                .entries()
                 .iter()
-                .filter(|e| e.file_size <= threshold_bytes)
-                .collect()
-        },
-    );
-
-    let row_data: Vec<FileRowData> = filtered_entries
-        .iter()
-        .map(|e| FileRowData {
-            file_name: SharedString::from(&e.file_name),
-            file_size: SharedString::from(e.size_display()),
-            num_files: SharedString::from(e.file_count_display()),
-            mod_name: SharedString::from(e.mod_display()),
-            is_bad: e.is_corrupted(),
-        })
-        .collect();
-
-    let total_size: u64 = filtered_entries.iter().map(|e| e.file_size).sum();
+                .filter(|e| {
+                    threshold.is_none_or(|threshold_bytes| e.file_size() <= threshold_bytes)
+                })
+                .map(|e| {
+                    total_size += e.file_size();
+                    FileRowData::from(e)
+                }),
+        );
+        (row_data, total_size)
+    };
+    let shown_files = row_data.len();
 
-    ui.set_file_list(ModelRc::new(VecModel::from(row_data)));
-    ui.set_total_files(filtered_entries.len().try_into().unwrap_or(i32::MAX));
+    set_file_rows(ui, row_data);
+    ui.set_total_files(shown_files.try_into().unwrap_or(i32::MAX));
     ui.set_total_size(SharedString::from(format_size(total_size, BINARY)));
 
     tracing::debug!(
         "Refreshed table: {} files shown{}",
-        filtered_entries.len(),
+        shown_files,
         if threshold.is_some() {
             " (filtered)"
         } else {
@@ -1334,47 +1490,42 @@ fn setup_log_viewer_callbacks(main_window: &MainWindow) {
                 }
 
                 // Apply filter
-                let log_level = match filter_level {
-                    Some(0) => Some(LogLevel::Error),
-                    Some(1) => Some(LogLevel::Warn),
-                    Some(2) => Some(LogLevel::Info),
-                    Some(3) => Some(LogLevel::Debug),
-                    Some(4) => Some(LogLevel::Trace),
-                    _ => None,
-                };
-                viewer.set_filter(log_level);
+                viewer.set_filter(filter_level.and_then(LogLevel::from_filter_index));
 
-                // Convert entries to Slint model
+                // Convert entries to Slint rows straight from the loaded log
                 let entries: Vec<LogRowData> = viewer
-                    .get_filtered_entries()
-                    .iter()
+                    .filtered_entries()
                     .map(|entry| {
-                        let level_str = entry.level.map(|l| l.to_string()).unwrap_or_default();
-                        let color_str = entry.level.map_or("#FFFFFF", |l| l.color());
-
-                        // Parse color string to slint::Color
+                        // Level names and colors are constants; no per-entry
+                        // formatting or hex parsing
+                        let level_str = entry.level.map_or("", |l| l.as_str());
                         let color = slint::Color::from_argb_encoded(
-                            u32::from_str_radix(&color_str[1..], 16).unwrap_or(0xFFFF_FFFF)
-                                | 0xFF00_0000, // Ensure full opacity
+                            entry.level.map_or(0xFFFF_FFFF, |l| l.argb()),
                         );
 
                         LogRowData {
                             timestamp: SharedString::from(
-                                entry.timestamp.clone().unwrap_or_default(),
+                                entry.timestamp.as_deref().unwrap_or_default(),
                             ),
                             level: SharedString::from(level_str),
-                            target: SharedString::from(entry.target.clone().unwrap_or_default()),
-                            message: SharedString::from(entry.message.clone()),
+                            target: SharedString::from(entry.target.as_deref().unwrap_or_default()),
+                            message: SharedString::from(entry.message.as_str()),
                             color,
                         }
                     })
                     .collect();
 
-                // Update UI with log entries
+                // Update UI with all log entries in one model update
                 slint::invoke_from_event_loop(move || {
                     if let Some(ui) = ui_weak_clone.upgrade() {
-                        let model = Rc::new(VecModel::from(entries));
-                        ui.set_log_entries(ModelRc::from(model));
+                        let log_entries = ui.get_log_entries();
+                        if let Some(model) =
+                            log_entries.as_any().downcast_ref::<VecModel<LogRowData>>()
+                        {
+                            model.set_vec(entries);
+                        } else {
+                            ui.set_log_entries(ModelRc::from(Rc::new(VecModel::from(entries))));
+                        }
                         tracing::debug!("Refreshed log viewer");
                     }
                 })
@@ -1386,16 +1537,14 @@ fn setup_log_viewer_callbacks(main_window: &MainWindow) {
     // Clear logs callback
     {
         let ui_weak = main_window.as_weak();
+        // These callbacks already run on the UI thread, so they update it
+        // directly instead of queueing a fresh closure per invocation
         main_window.on_log_viewer_clear(move || {
-            let ui_weak = ui_weak.clone();
-            slint::invoke_from_event_loop(move || {
-                if let Some(ui) = ui_weak.upgrade() {
-                    let empty_model = Rc::new(VecModel::<LogRowData>::default());
-                    ui.set_log_entries(ModelRc::from(empty_model));
-                    tracing::debug!("Cleared log viewer");
-                }
-            })
-            .ok();
+            if let Some(ui) = ui_weak.upgrade() {
+                let empty_model = Rc::new(VecModel::<LogRowData>::default());
+                ui.set_log_entries(ModelRc::from(empty_model));
+                tracing::debug!("Cleared log viewer");
+            }
         });
     }
 
@@ -1414,21 +1563,12 @@ fn setup_log_viewer_callbacks(main_window: &MainWindow) {
                 }
 
                 // Apply filter
-                let log_level = match filter_level {
-                    Some(0) => Some(LogLevel::Error),
-                    Some(1) => Some(LogLevel::Warn),
-                    Some(2) => Some(LogLevel::Info),
-                    Some(3) => Some(LogLevel::Debug),
-                    Some(4) => Some(LogLevel::Trace),
-                    _ => None,
-                };
-                viewer.set_filter(log_level);
+                viewer.set_filter(filter_level.and_then(LogLevel::from_filter_index));
 
                 // Format logs as text
                 let log_text: String = viewer
-                    .get_filtered_entries()
-                    .iter()
-                    .map(|entry| entry.raw_line.clone())
+                    .filtered_entries()
+                    .map(|entry| entry.raw_line.as_str())
                     .collect::<Vec<_>>()
                     .join("\n");
 
@@ -1444,16 +1584,12 @@ fn setup_log_viewer_callbacks(main_window: &MainWindow) {
     {
         let ui_weak = main_window.as_weak();
         main_window.on_log_viewer_filter_changed(move |level| {
-            let ui_weak = ui_weak.clone();
-            slint::invoke_from_event_loop(move || {
-                if let Some(ui) = ui_weak.upgrade() {
-                    ui.set_log_filter_level(level);
-                    // Trigger refresh with new filter
-                    ui.invoke_log_viewer_refresh();
-                    tracing::debug!("Log viewer filter changed to level: {}", level);
-                }
-            })
-            .ok();
+            if let Some(ui) = ui_weak.upgrade() {
+                ui.set_log_filter_level(level);
+                // Trigger refresh with new filter
+                ui.invoke_log_viewer_refresh();
+                tracing::debug!("Log viewer filter changed to level: {}", level);
+            }
         });
     }
 
@@ -1461,97 +1597,108 @@ fn setup_log_viewer_callbacks(main_window: &MainWindow) {
     {
         let ui_weak = main_window.as_weak();
         main_window.on_log_viewer_toggle(move || {
-            let ui_weak = ui_weak.clone();
-            slint::invoke_from_event_loop(move || {
-                if let Some(ui) = ui_weak.upgrade() {
-                    let current = ui.get_show_log_viewer();
-                    ui.set_show_log_viewer(!current);
-
-                    // If opening, refresh logs
-                    if !current {
-                        ui.invoke_log_viewer_refresh();
-                    }
+            if let Some(ui) = ui_weak.upgrade() {
+                let current = ui.get_show_log_viewer();
+                ui.set_show_log_viewer(!current);
 
-                    tracing::debug!("Log viewer toggled: {}", !current);
+                // If opening, refresh logs
+                if !current {
+                    ui.invoke_log_viewer_refresh();
                 }
-            })
-            .ok();
+
+                tracing::debug!("Log viewer toggled: {}", !current);
+            }
         });
     }
 
     tracing::info!("Log viewer callbacks initialized");
 }
 
-#[cfg(test)]
-mod tests {
+/// Split a comma-separated settings value into trimmed, non-empty items
+///
+/// Items wrapped in double quotes may contain commas, matching what
+/// `format_setting_list` writes for paths such as `C:\Mods\A, B\x.ba2`.
+/// Repeated items are dropped, keeping the first occurrence so the stored
+/// order matches what the user typed. Membership is tracked in a set so the
+/// check stays constant-time however long the list grows.
+fn parse_setting_list(value: &str) -> Vec<String> {
+    let mut seen = HashSet::new();
+    let mut items = Vec::new();
+    let mut current = String::new();
+    let mut quoted = false;
+
+    let mut push_item = |item: &str| {
+        let item = item.trim();
+        if !item.is_empty() && seen.insert(item.to_string()) {
+            items.push(item.to_string());
+        }
+    };
 
-    #[test]
-    fn test_slint_module_exists() {
-        // This test verifies that the Slint code was successfully compiled
-        // We can't actually run the UI in tests, but we can verify it compiles
-        assert!(true, "Slint module compiled successfully");
+    for c in value.chars() {
+        match c {
+            '"' => quoted = !quoted,
+            ',' if !quoted => {
+                push_item(&current);
+                current.clear();
+            }
+            _ => current.push(c),
+        }
+    }
+    push_item(&current);
+
+    items
+}
+
+/// Join list settings for display, quoting items that contain a comma
+fn format_setting_list(items: &[String]) -> String {
+    items
+        .iter()
+        .map(|item| {
+            if item.contains(',') {
+                format!("\"{item}\"")
+            } else {
+                item.clone()
+            }
+        })
+        .collect::<Vec<_>>()
+        .join(", ")
+}
+
+/// Store a new setting value, returning whether it differs from the old one
+fn replace_setting<T: PartialEq>(setting: &mut T, value: T) -> bool {
+    if *setting == value {
+        false
+    } else {
+        *setting = value;
+        true
     }
 }
+
 /// Set up settings callbacks (Phase 2.2)
 fn setup_settings_callbacks(main_window: &MainWindow, state: &Arc<Mutex<AppState>>) {
     // Handle setting changes
     let state_for_settings = Arc::clone(state);
-    main_window.on_settings_changed(move |key, value| {
-        let key_str = key.to_string();
-        let value_str = value.to_string();
-        tracing::info!("Setting changed: {} = {}", key_str, value_str);
 
-        let state_clone = Arc::clone(&state_for_settings);
+    // Text settings fire on every keystroke; keep the latest value per key
+    // in the shared state and apply them together once typing pauses
+    let debounce = Timer::default();
 
-        // Update config in background to avoid blocking UI
-        std::thread::spawn(move || {
-            let save_result = {
-                let mut app_state = state_clone.lock();
-                let config = &mut app_state.config;
-                let mut save_needed = true;
-
-                match key_str.as_str() {
-                    "postfixes" => {
-                        // Split by comma and trim
-                        config.extraction.postfixes = value_str
-                            .split(',')
-                            .map(|s| s.trim().to_string())
-                            .filter(|s| !s.is_empty())
-                            .collect();
-                    }
-                    "ignored_files" => {
-                        config.extraction.ignored_files = value_str
-                            .split(',')
-                            .map(|s| s.trim().to_string())
-                            .filter(|s| !s.is_empty())
-                            .collect();
-                    }
-                    "theme_mode" => {
-                        config.appearance.theme_mode = value_str;
-                    }
-                    "language" => {
-                        config.appearance.language = value_str;
-                    }
-                    _ => {
-                        tracing::warn!("Unknown setting key: {}", key_str);
-                        save_needed = false;
-                    }
-                }
+    main_window.on_settings_changed(move |key, value| {
+        tracing::debug!("Setting edited: {} = {}", key, value);
+        state_for_settings
+            .lock()
+            .pending_settings
+            .insert(key.to_string(), value.to_string());
 
-                if save_needed {
-                    Some(config.save())
-                } else {
-                    None
-                }
-            };
+        let state_clone = Arc::clone(&state_for_settings);
+        debounce.start(TimerMode::SingleShot, SETTINGS_DEBOUNCE, move || {
+            let state = Arc::clone(&state_clone);
 
-            if let Some(result) = save_result {
-                if let Err(e) = result {
-                    tracing::error!("Failed to save configuration: {}", e);
-                } else {
-                    tracing::debug!("Configuration saved");
-                }
-            }
+            // Update config in background to avoid blocking UI
+            std::thread::spawn(move || {
+                apply_pending_settings(&mut state.lock());
+                save_pending_config(&state);
+            });
         });
     });
 
@@ -1566,18 +1713,19 @@ fn setup_settings_callbacks(main_window: &MainWindow, state: &Arc<Mutex<AppState
             let save_result = {
                 let mut app_state = state.lock();
                 let config = &mut app_state.config;
-                let mut save_needed = true;
 
-                match key_str.as_str() {
-                    "ignore_bad_files" => config.extraction.ignore_bad_files = value,
-                    "auto_backup" => config.extraction.auto_backup = value,
-                    "check_updates" => config.update.check_at_startup = value,
-                    "show_debug" => config.advanced.show_debug = value,
+                let save_needed = match key_str.as_str() {
+                    "ignore_bad_files" => {
+                        replace_setting(&mut config.extraction.ignore_bad_files, value)
+                    }
+                    "auto_backup" => replace_setting(&mut config.extraction.auto_backup, value),
+                    "check_updates" => replace_setting(&mut config.update.check_at_startup, value),
+                    "show_debug" => replace_setting(&mut config.advanced.show_debug, value),
                     _ => {
                         tracing::warn!("Unknown toggle setting key: {}", key_str);
-                        save_needed = false;
+                        false
                     }
-                }
+                };
 
                 if save_needed {
                     Some(config.save())
@@ -1592,3 +1740,79 @@ fn setup_settings_callbacks(main_window: &MainWindow, state: &Arc<Mutex<AppState
         });
     });
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_slint_module_exists() {
+        // This test verifies that the Slint code was successfully compiled
+        // We can't actually run the UI in tests, but we can verify it compiles
+        assert!(true, "Slint module compiled successfully");
+    }
+
+    #[test]
+    fn test_entry_index_for_row_follows_threshold() {
+        let mut app_state = AppState::new(AppConfig::default());
+        for (name, size) in [("a.ba2", 300), ("b.ba2", 100), ("c.ba2", 200)] {
+            app_state.file_entries.push(FileEntry::new(
+                name.to_string(),
+                size,
+                1,
+                "Mod".to_string(),
+                PathBuf::from(format!("/mods/Mod/{name}")),
+                false,
+            ));
+        }
+
+        assert_eq!(entry_index_for_row(&app_state, 0), Some(0));
+
+        // With a 250 byte threshold the table shows b.ba2 then c.ba2
+        app_state.applied_threshold = Some(250);
+        assert_eq!(entry_index_for_row(&app_state, 0), Some(1));
+        assert_eq!(entry_index_for_row(&app_state, 1), Some(2));
+        assert_eq!(entry_index_for_row(&app_state, 2), None);
+    }
+
+    #[test]
+    fn test_apply_pending_settings_marks_config_dirty() {
+        let mut app_state = AppState::new(AppConfig::default());
+        app_state
+            .pending_settings
+            .insert("ignored_files".to_string(), "a.ba2, b.ba2".to_string());
+
+        apply_pending_settings(&mut app_state);
+        assert!(app_state.pending_settings.is_empty());
+        assert!(app_state.config_dirty);
+        assert_eq!(
+            app_state.config.extraction.ignored_files,
+            ["a.ba2", "b.ba2"]
+        );
+    }
+
+    #[test]
+    fn test_replace_setting_reports_changes() {
+        let mut ignored = parse_setting_list(" a.ba2, b.ba2 ,a.ba2");
+        assert_eq!(ignored, ["a.ba2", "b.ba2"]);
+
+        // Same list after parsing - nothing to save
+        assert!(!replace_setting(
+            &mut ignored,
+            parse_setting_list("a.ba2,b.ba2")
+        ));
+        assert!(replace_setting(&mut ignored, parse_setting_list("a.ba2")));
+        assert_eq!(ignored, ["a.ba2"]);
+    }
+
+    #[test]
+    fn test_setting_list_round_trips_commas() {
+        let ignored = vec![
+            r"C:\Mods\A, B\A - Main.ba2".to_string(),
+            "b.ba2".to_string(),
+        ];
+        let text = format_setting_list(&ignored);
+        assert_eq!(text, r#""C:\Mods\A, B\A - Main.ba2", b.ba2"#);
+        assert_eq!(parse_setting_list(&text), ignored);
+    }
+}
@@ -7,11 +7,14 @@ use anyhow::{Context, Result};
 use semver::Version;
 use serde::Deserialize;
 
-/// GitHub repository information
-const GITHUB_OWNER: &str = "evildarkarchon";
-const GITHUB_REPO: &str = "ba2-batch-unpack-gui";
+/// GitHub API endpoint for the latest release of this repository
+const LATEST_RELEASE_URL: &str =
+    "https://api.github.com/repos/evildarkarchon/ba2-batch-unpack-gui/releases/latest";
 const CURRENT_VERSION: &str = env!("CARGO_PKG_VERSION");
 
+/// User agent sent with GitHub API requests, built at compile time
+const USER_AGENT: &str = concat!("unpackrr/", env!("CARGO_PKG_VERSION"));
+
 /// GitHub API release response structure
 #[derive(Debug, Deserialize)]
 struct GitHubRelease {
@@ -79,17 +82,14 @@ pub struct UpdateInfo {
 pub async fn check_for_updates() -> Result<Option<UpdateInfo>> {
     tracing::info!("Checking for updates from GitHub...");
 
-    // Build GitHub API URL
-    let url = format!("https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}/releases/latest");
-
     // Fetch latest release from GitHub
     let client = reqwest::Client::builder()
-        .user_agent(format!("unpackrr/{CURRENT_VERSION}"))
+        .user_agent(USER_AGENT)
         .build()
         .context("Failed to create HTTP client")?;
 
     let response = client
-        .get(&url)
+        .get(LATEST_RELEASE_URL)
         .send()
         .await
         .context("Failed to fetch latest release from GitHub")?;